@@ -18,6 +18,7 @@ import os
 import numpy as np
 
 import Xsec_aux_functions as xaf
+import Xsec_plotting_functions as xpf
 
 # %% paths
 
@@ -49,8 +50,8 @@ wvn = np.linspace(750, 1250, 50001)
 xsec = xaf.calculate_cross_sections(wvn, xsec_data, temperature=temperature, pressure=pressure)
 
 # Plot cross sections
-fig0, ax0 = xaf.default_figure(1, 1)
-ax0 = xaf.plot_xsec(wvn, xsec, [], ax0,
+fig0, ax0 = xpf.default_figure(1, 1)
+ax0 = xpf.plot_xsec(wvn, xsec, [], ax0,
                     xlabel='Wavenumber [cm$^{-1}$]',
                     ylabel='$a_{xsec}$ m$^2$',
                     plot_title=f"{pressure:.2f}$\,$Pa $-$ {temperature:.0f}$\,$K")
@@ -25,6 +25,7 @@ import pyarts
 from typhon import constants
 
 import Xsec_aux_functions as xaf
+import Xsec_plotting_functions as xpf
 
 
 # %%
@@ -84,10 +85,10 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
         fit_goodness = [[]] * len(wvn)
         fit_coeffs = np.zeros((6, len(wvn)))
         N_data = np.zeros(len(wvn))
-        MinP = np.zeros(len(wvn)) * np.nan
-        MaxP = np.zeros(len(wvn)) * np.nan
-        MinT = np.zeros(len(wvn)) * np.nan
-        MaxT = np.zeros(len(wvn)) * np.nan
+        MinP = np.full(len(wvn), np.nan)
+        MaxP = np.full(len(wvn), np.nan)
+        MinT = np.full(len(wvn), np.nan)
+        MaxT = np.full(len(wvn), np.nan)
 
         T = np.zeros(len(data))
         P = np.zeros(len(data))
@@ -96,18 +97,12 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             T[i] = data[i]['temperature']
             P[i] = data[i]['pressure']
 
-        for idx in range(len(wvn)):
+        # fit all frequencies of the band at once
+        Xsec = np.array([data_i['xsec'] for data_i in data])
 
-            if idx % 100 == 0:
-                print(str(idx))
+        fit_results = xaf.fit_xsec_data_batch(T, P, Xsec, min_deltaLogP=0.2, min_deltaT=20.)
 
-            # allocate
-            Xsec = np.zeros(len(data))
-
-            for i in range(len(data)):
-                Xsec[i] = data[i]['xsec'][idx]
-
-            fit_result = xaf.fit_xsec_data(T, P, Xsec, min_deltaLogP=0.2, min_deltaT=20.)
+        for idx, fit_result in enumerate(fit_results):
 
             fit_coeffs[:, idx] = fit_result['coefficients']
             N_data[idx] = fit_result['NumberOfPoints']
@@ -149,20 +144,20 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
 
         if plotting:
 
-            RMSE = np.zeros(np.shape(T)) * np.nan
-            bias = np.zeros(np.shape(T)) * np.nan
-            StDev = np.zeros(np.shape(T)) * np.nan
-            XsecMean = np.zeros(np.shape(T)) * np.nan
-            XsecSum = np.zeros(np.shape(T)) * np.nan
-            XsecMeanFit = np.zeros(np.shape(T)) * np.nan
-            XsecSumFit = np.zeros(np.shape(T)) * np.nan
-            XsecInt = np.zeros(np.shape(T)) * np.nan
-            DeltaXsecInt = np.zeros(np.shape(T)) * np.nan
-            XsecIntFit = np.zeros(np.shape(T)) * np.nan
-            XsecIntFitFull = np.zeros(np.shape(T)) * np.nan
+            RMSE = np.full(T.shape, np.nan)
+            bias = np.full(T.shape, np.nan)
+            StDev = np.full(T.shape, np.nan)
+            XsecMean = np.full(T.shape, np.nan)
+            XsecSum = np.full(T.shape, np.nan)
+            XsecMeanFit = np.full(T.shape, np.nan)
+            XsecSumFit = np.full(T.shape, np.nan)
+            XsecInt = np.full(T.shape, np.nan)
+            DeltaXsecInt = np.full(T.shape, np.nan)
+            XsecIntFit = np.full(T.shape, np.nan)
+            XsecIntFitFull = np.full(T.shape, np.nan)
             R2 = np.zeros(np.size(fit_coeffs, axis=1))
-            XsecTest = np.zeros((np.size(T), np.size(fit_coeffs, axis=1))) * np.nan
-            XsecTestFit = np.zeros((np.size(T), np.size(fit_coeffs, axis=1))) * np.nan
+            XsecTest = np.full((np.size(T), np.size(fit_coeffs, axis=1)), np.nan)
+            XsecTestFit = np.full((np.size(T), np.size(fit_coeffs, axis=1)), np.nan)
             logic_notnan = np.zeros((np.size(T), np.size(fit_coeffs, axis=1)), dtype=bool)
 
             for i in range(len(RMSE)):
@@ -212,7 +207,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
 
             print('Plotting fig0 ')
 
-            fig0, axs0 = xaf.default_figure(3, 3)
+            fig0, axs0 = xpf.default_figure(3, 3)
 
             for i in range(len(index)):
 
@@ -252,14 +247,14 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                 else:
                     legend = False
 
-                axs0[row, col] = xaf.plot_xsec(wvn, xsec, xsec_fit, ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
+                axs0[row, col] = xpf.plot_xsec(wvn, xsec, xsec_fit, ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
                                                plot_title=plot_title, legend=legend)
 
             # %% plot differences for some points
 
             print('Plotting fig1 ')
 
-            fig1, axs1 = xaf.default_figure(3, 3)
+            fig1, axs1 = xpf.default_figure(3, 3)
 
             for i in range(len(index)):
 
@@ -292,53 +287,53 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                 else:
                     xlabel = None
 
-                axs1[row, col] = xaf.plot_xsec(wvn, dxsec, [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
+                axs1[row, col] = xpf.plot_xsec(wvn, dxsec, [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
                                                plot_title=plot_title)
 
             # %% plot overview
 
             print('Plotting fig2')
 
-            fig2, axs2 = xaf.default_figure(3, 3, sharey='all', sharex='all',
+            fig2, axs2 = xpf.default_figure(3, 3, sharey='all', sharex='all',
                                             width_in_cm=29.7, height_in_cm=29.7)
 
             z11 = RMSE / XsecMean * 100
-            fig2, axs2[0, 0] = xaf.scatter_plot(T, P, z11, fig2, axs2[0, 0], clim=[0, 40],
+            fig2, axs2[0, 0] = xpf.scatter_plot(T, P, z11, fig2, axs2[0, 0], clim=[0, 40],
                                                 plot_title='$\\frac{RMSE}{<a_{xsec,obs}>}$',
                                                 cbar_label='[$\%$]')
             axs2[0, 0].invert_yaxis()
 
             z12 = bias / XsecMean * 100
-            fig2, axs2[0, 1] = xaf.scatter_plot(T, P, z12, fig2, axs2[0, 1], clim=[-5, 5],
+            fig2, axs2[0, 1] = xpf.scatter_plot(T, P, z12, fig2, axs2[0, 1], clim=[-5, 5],
                                                 plot_title='$\\frac{<\\Delta a_{xsec}>}{<a_{xsec,obs}>}$',
                                                 cbar_label='[$\\%$]', cmap='difference')
 
             z21 = StDev
-            fig2, axs2[1, 0] = xaf.scatter_plot(T, P, z21, fig2, axs2[1, 0],
+            fig2, axs2[1, 0] = xpf.scatter_plot(T, P, z21, fig2, axs2[1, 0],
                                                 plot_title='std($a_{xsec,obs}$)',
                                                 cbar_label='[m$^2$]')
 
             z22 = XsecInt
             z22_max = np.max([XsecInt.max(), XsecIntFit.max()])
             z22_min = np.min([XsecInt.min(), XsecIntFit.min()])
-            fig2, axs2[1, 1] = xaf.scatter_plot(T, P, z22, fig2, axs2[1, 1], clim=[z22_min, z22_max],
+            fig2, axs2[1, 1] = xpf.scatter_plot(T, P, z22, fig2, axs2[1, 1], clim=[z22_min, z22_max],
                                                 plot_title='$\int a_{xsec,obs,raw}$',
                                                 cbar_label='[cm$^2$ cm$^{-1}$]')
 
             z31 = XsecIntFitFull
-            fig2, axs2[2, 0] = xaf.scatter_plot(T, P, z31, fig2, axs2[2, 0], clim=[z22_min, z22_max],
+            fig2, axs2[2, 0] = xpf.scatter_plot(T, P, z31, fig2, axs2[2, 0], clim=[z22_min, z22_max],
                                                 plot_title='$\int a_{xsec,fit}$',
                                                 cbar_label='[cm$^2$ cm$^{-1}$]')
 
             z32 = (XsecIntFit / XsecInt - 1) * 100
             z32_limit = np.max([abs(z32.min()), abs(z32.max())])
-            fig2, axs2[2, 1] = xaf.scatter_plot(T, P, z32, fig2, axs2[2, 1], clim=[-z32_limit, z32_limit],
+            fig2, axs2[2, 1] = xpf.scatter_plot(T, P, z32, fig2, axs2[2, 1], clim=[-z32_limit, z32_limit],
                                                 plot_title='$(\int a_{xsec,fit}/\int a_{xsec,obs,raw})-1$',
                                                 cbar_label='[$\\%$]', cmap='difference')
 
             z33 = DeltaXsecInt * 100
             z33_limit = np.max([abs(z33.min()), abs(z33.max())])
-            fig2, axs2[2, 2] = xaf.scatter_plot(T, P, z33, fig2, axs2[2, 2], clim=[-z33_limit, z33_limit],
+            fig2, axs2[2, 2] = xpf.scatter_plot(T, P, z33, fig2, axs2[2, 2], clim=[-z33_limit, z33_limit],
                                                 plot_title='$(\int a_{xsec,obs,inter}/\int a_{xsec,obs,raw})-1$',
                                                 cbar_label='[$\\%$]', cmap='difference')
 
@@ -346,7 +341,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
 
             print('Plotting fig3')
 
-            fig3, axs3 = xaf.default_figure(3, 2, sharey='none', sharex='all')
+            fig3, axs3 = xpf.default_figure(3, 2, sharey='none', sharex='all')
 
             coeff_names = fit_result['coeff_names']
             formula = fit_result['formula']
@@ -370,7 +365,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                 else:
                     xlabel = None
 
-                axs3[row, col] = xaf.plot_xsec(wvn, fit_coeffs[i, :], [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
+                axs3[row, col] = xpf.plot_xsec(wvn, fit_coeffs[i, :], [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
                                                plot_title=plot_title)
 
             y_var = '$y=\\log_{10} \\frac{p}{p_0}$'
@@ -386,7 +381,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             T_i = [np.min(MinT) * 0.9, np.max(MaxT) / 0.9]
             P_i = [10., np.min(MinP), np.max(MaxP)]
 
-            fig4, axs4 = xaf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9, height_in_cm=29.7)
+            fig4, axs4 = xpf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9, height_in_cm=29.7)
             fig4.subplots_adjust(hspace=0.5)
 
             for i in range(len(T_i)):
@@ -411,7 +406,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                     else:
                         xlabel = None
 
-                    axs4[row] = xaf.plot_xsec(wvn, xsec_fit, [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
+                    axs4[row] = xpf.plot_xsec(wvn, xsec_fit, [], ax, xlim=None, xlabel=xlabel, ylabel=ylabel,
                                               plot_title=plot_title)
 
             # %% edge cases T-derivative
@@ -421,7 +416,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             T_i = [np.min(MinT), np.max(MaxT)]
             P_i = [10., np.min(MinP), np.max(MaxP)]
 
-            fig41, axs41 = xaf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9,
+            fig41, axs41 = xpf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9,
                                               height_in_cm=29.7, sharey=False)
             fig41.subplots_adjust(hspace=0.5)
 
@@ -452,7 +447,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                     else:
                         xlabel = None
 
-                    axs41[row] = xaf.plot_xsec(wvn, DxsecDT, DxsecDTnum, axs41[row], xlim=None, xlabel=xlabel,
+                    axs41[row] = xpf.plot_xsec(wvn, DxsecDT, DxsecDTnum, axs41[row], xlim=None, xlabel=xlabel,
                                                ylabel=ylabel,
                                                plot_title=plot_title)
 
@@ -463,7 +458,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             T_i = [np.min(MinT), np.max(MaxT)]
             P_i = [10., np.min(MinP), np.max(MaxP)]
 
-            fig42, axs42 = xaf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9,
+            fig42, axs42 = xpf.default_figure(len(T_i) * len(P_i), 1, width_in_cm=20.9,
                                               height_in_cm=29.7, sharey=False)
             fig42.subplots_adjust(hspace=0.5)
 
@@ -492,7 +487,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
                     else:
                         xlabel = None
 
-                    axs41[row] = xaf.plot_xsec(wvn, DxsecDP, DxsecDPnum, axs42[row], xlim=None, xlabel=xlabel,
+                    axs41[row] = xpf.plot_xsec(wvn, DxsecDP, DxsecDPnum, axs42[row], xlim=None, xlabel=xlabel,
                                                ylabel=ylabel,
                                                plot_title=plot_title)
 
@@ -503,7 +498,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             Ptest = np.logspace(3, np.log10(101325), 100)
             Ttest = np.linspace(180, 300, 121)
 
-            Xmean = np.zeros((len(Ptest), len(Ttest))) * np.nan
+            Xmean = np.full((len(Ptest), len(Ttest)), np.nan)
 
             for i in range(len(Ptest)):
                 for j in range(len(Ttest)):
@@ -517,20 +512,20 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             Xmean[Ptest > np.max(MaxP), :] = np.nan
 
             Xmean_p = np.nanmean(Xmean, axis=0)
-            Xmean_r = Xmean * np.nan
+            Xmean_r = np.full_like(Xmean, np.nan)
 
             # change in pressure relative to mean over pressure
             for j in range(len(Ttest)):
                 Xmean_r[:, j] = Xmean[:, j] / Xmean_p[j] - 1.
 
-            fig5, axs5 = xaf.default_figure(1, 2)
+            fig5, axs5 = xpf.default_figure(1, 2)
 
             xlabel = 'Temperature [K]'
             ylabel = 'Pressure [hPa]'
             cbar_label = '[m$^2$]'
             title = '$\\overline{a_{xsec,f}}$ (fit)'
 
-            fig5, axs5[0], pcm, cbar = xaf.pcolor_plot(Ttest, Ptest / 100, Xmean, fig5, axs5[0],
+            fig5, axs5[0], pcm, cbar = xpf.pcolor_plot(Ttest, Ptest / 100, Xmean, fig5, axs5[0],
                                                        np.nanmin(Xmean), np.nanmax(Xmean),
                                                        xlabel=xlabel, ylabel=ylabel,
                                                        cmap='temperature', title=title,
@@ -540,7 +535,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
 
             title = '$\\frac{\\overline{a_{xsec,f}} (p,T) } {< \\overline{a_{xsec,f}} >_p} -1 $'
             cbar_label = '[$\\%$]'
-            fig5, axs5[1], pcm, cbar = xaf.pcolor_plot(Ttest, Ptest / 100, Xmean_r * 100, fig5, axs5[1],
+            fig5, axs5[1], pcm, cbar = xpf.pcolor_plot(Ttest, Ptest / 100, Xmean_r * 100, fig5, axs5[1],
                                                        -5., 5.,
                                                        xlabel=xlabel,
                                                        cmap='difference', title=title,
@@ -550,32 +545,32 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
 
             print('Plotting fig6')
 
-            fig6, axs6 = xaf.default_figure(6, 1, width_in_cm=20.9, height_in_cm=29.7, sharey='none')
+            fig6, axs6 = xpf.default_figure(6, 1, width_in_cm=20.9, height_in_cm=29.7, sharey='none')
             fig6.subplots_adjust(hspace=0.5)
 
             # Number of points per fit
             plot_title = 'Number of points per fit'
             ylabel = '$N_{obs}$ [$\\,$]'
 
-            axs6[0] = xaf.plot_xsec(wvn, N_data, [], axs6[0], xlim=None, xlabel=None, ylabel=ylabel,
+            axs6[0] = xpf.plot_xsec(wvn, N_data, [], axs6[0], xlim=None, xlabel=None, ylabel=ylabel,
                                     plot_title=plot_title)
 
             # minimum temperature of fit
             plot_title = 'Minimum temperature of fit'
             ylabel = '$T_{min}$ [K]'
-            axs6[1] = xaf.plot_xsec(wvn, MinT, [], axs6[1], xlim=None, xlabel=None, ylabel=ylabel,
+            axs6[1] = xpf.plot_xsec(wvn, MinT, [], axs6[1], xlim=None, xlabel=None, ylabel=ylabel,
                                     plot_title=plot_title)
 
             # maximum temperature of fit
             plot_title = 'Maximum temperature of fit'
             ylabel = '$T_{min}$ [K]'
-            axs6[2] = xaf.plot_xsec(wvn, MaxT, [], axs6[2], xlim=None, xlabel=None, ylabel=ylabel,
+            axs6[2] = xpf.plot_xsec(wvn, MaxT, [], axs6[2], xlim=None, xlabel=None, ylabel=ylabel,
                                     plot_title=plot_title)
 
             # minimum pressure of fit
             plot_title = 'Minimum pressure of fit'
             ylabel = '$p_{min}$ [hPa]'
-            axs6[3] = xaf.plot_xsec(wvn, MinP / 100, [], axs6[3], xlim=None, xlabel=None, ylabel=ylabel,
+            axs6[3] = xpf.plot_xsec(wvn, MinP / 100, [], axs6[3], xlim=None, xlabel=None, ylabel=ylabel,
                                     plot_title=plot_title)
             # axs6[3].set_yscale('log')
 
@@ -583,14 +578,14 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             plot_title = 'Maximum pressure of fit'
             ylabel = '$p_{min}$ [hPa]'
             xlabel = 'Wavenumber [cm$^{-1}$]'
-            axs6[4] = xaf.plot_xsec(wvn, MaxP / 100, [], axs6[4], xlim=None, xlabel=xlabel, ylabel=ylabel,
+            axs6[4] = xpf.plot_xsec(wvn, MaxP / 100, [], axs6[4], xlim=None, xlabel=xlabel, ylabel=ylabel,
                                     plot_title=plot_title)
             # axs6[4].set_yscale('log')
 
             plot_title = 'Goodness of fit'
             ylabel = '$R^2$'
             xlabel = 'Wavenumber [cm$^{-1}$]'
-            axs6[5] = xaf.plot_xsec(wvn, R2, [], axs6[5], xlim=None, xlabel=xlabel, ylabel=ylabel,
+            axs6[5] = xpf.plot_xsec(wvn, R2, [], axs6[5], xlim=None, xlabel=xlabel, ylabel=ylabel,
                                     plot_title=plot_title)
 
             # %% save figures
@@ -631,7 +626,7 @@ def process_xsec_coefficients(species, harmonized_folder, coeff_folder, main_plo
             plotname6 = os.path.join(plotfolder, species_arts + band_str + '.fit_limits.pdf')
             fig6.savefig(plotname6)
 
-            xaf.plt.close('all')
+            xpf.plt.close('all')
 
     # %%
 
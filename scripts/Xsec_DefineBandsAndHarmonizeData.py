@@ -27,6 +27,7 @@ import numpy as np
 from scipy.interpolate import interp1d
 
 import Xsec_aux_functions as xaf
+import Xsec_plotting_functions as xpf
 
 # %% constants, paths
 
@@ -122,13 +123,10 @@ if new_config_flag == 1:
         overlapp = 0
         if number_of_sets > 1:
 
-            for u in range(number_of_sets):
-                for v in range(number_of_sets):
+            ol = xaf.getOverlap_array(wvn_intervalls, wvn_intervalls) > 0
+            np.fill_diagonal(ol, False)
 
-                    if u != v:
-                        ol = xaf.getOverlap(wvn_intervalls[u, :], wvn_intervalls[v, :])
-
-                        overlapp = overlapp + int(ol > 0)
+            overlapp = int(np.sum(ol))
 
         if overlapp == 0:
             for j in range(number_of_sets):
@@ -140,17 +138,17 @@ if new_config_flag == 1:
             if overview_flag == True:
 
                 # Plot rawdata with new bands
-                fig1, ax1 = xaf.plot_raw_data(xsec_data, species)
+                fig1, ax1 = xpf.plot_raw_data(xsec_data, species)
 
                 for j in range(0, len(ax1)):
-                    ax1[j] = xaf.make_band_patches(ax1[j], config_list[cnt][1:],
+                    ax1[j] = xpf.make_band_patches(ax1[j], config_list[cnt][1:],
                                                    [1e-24, 1e-15], edgecolor='None')
 
         else:
 
             if overview_flag == True:
                 # #Show overview plots
-                fig1, ax1 = xaf.plot_raw_data(xsec_data, species)
+                fig1, ax1 = xpf.plot_raw_data(xsec_data, species)
 
             input1 = 0
             if old_flag:
@@ -162,10 +160,10 @@ if new_config_flag == 1:
 
                 if overview_flag == True:
                     for j in range(0, len(ax1)):
-                        ax1[j] = xaf.make_band_patches(ax1[j], config_list_old[cnt][1:],
+                        ax1[j] = xpf.make_band_patches(ax1[j], config_list_old[cnt][1:],
                                                        [1e-24, 1e-15], edgecolor='None')
 
-                    xaf.plt.show()
+                    xpf.plt.show()
 
                 print('to use old values press enter or to define new ones type number of bands')
                 N_bands = input('==>>')
@@ -215,13 +213,13 @@ if new_config_flag == 1:
                 if overview_flag == True:
 
                     # Plot rawdata with new bands
-                    fig1, ax1 = xaf.plot_raw_data(xsec_data, species)
+                    fig1, ax1 = xpf.plot_raw_data(xsec_data, species)
 
                     for j in range(0, len(ax1)):
-                        ax1[j] = xaf.make_band_patches(ax1[j], config_list[cnt][1:],
+                        ax1[j] = xpf.make_band_patches(ax1[j], config_list[cnt][1:],
                                                        [1e-24, 1e-15], edgecolor='None')
 
-                    xaf.plt.show()
+                    xpf.plt.show()
 
         print('')
         print('-------------------------------------------------------------------')
@@ -232,7 +230,7 @@ if new_config_flag == 1:
 
             plotname1 = plot_folder + species + '.png'
             fig1.savefig(plotname1, dpi=300, bbox_inches='tight')
-            xaf.plt.close(fig=fig1)
+            xpf.plt.close(fig=fig1)
 
     with open(config_name, 'w') as fout:
         json.dump(config_list, fout)
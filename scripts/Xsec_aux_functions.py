@@ -8,26 +8,72 @@ Created on Fri Sep 25 16:10:11 2020
 This file contains the functions that are needed for the harmonization of the Hitran
 absorption cross section data and for the calculations of the fit coefficients.
 """
+import math
 from glob import glob
 from os import path
 
-import matplotlib.patches as ptch
-import matplotlib.pyplot as plt
 import numpy as np
 import pyarts
-from matplotlib.font_manager import FontProperties
-from scipy.interpolate import interp1d
-from scipy.linalg import lstsq
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, lstsq
+
+# numba is optional, without it the pure numpy implementations are used
+try:
+    import numba
+except ImportError:
+    numba = None
 
 # %% constants
 
 # speed of light
 c0 = 299792458.0  # [m/s]
 
+# natural logarithm of 10
+_LN10 = math.log(10.)
+
 
 # %% fit related functions
 
 
+def _solve_lstsq(M, zdata):
+    '''
+    Solves the least squares problem M @ poly = zdata via the normal
+    equations. The design matrices here have at most six columns, so
+    forming M.T @ M and solving the small system with a Cholesky
+    factorization is much cheaper than the SVD based lstsq, which is
+    kept as fallback for singular designs.
+
+    Args:
+        M: matrix
+            design matrix.
+        zdata:  vector or matrix
+            data, one column per fit.
+
+    Returns:
+        poly:   vector or matrix
+            coefficients of fit.
+        res:    float or vector
+            summed residuums.
+        rnk:    int
+            Effective rank of design matrix M.
+        s:      ndarray or None
+            Singular values of M, None if the Cholesky path was taken.
+
+    '''
+
+    try:
+        c_and_low = cho_factor(M.T @ M)
+        poly = cho_solve(c_and_low, M.T @ zdata)
+
+        res = np.sum((zdata - M @ poly) ** 2, axis=0)
+        rnk = np.size(M, axis=1)
+        s = None
+
+    except LinAlgError:
+        poly, res, rnk, s = lstsq(M, zdata)
+
+    return poly, res, rnk, s
+
+
 def fit_poly22(xdata, ydata, zdata):
     '''
     2d quadratic fit:
@@ -53,14 +99,16 @@ def fit_poly22(xdata, ydata, zdata):
 
     '''
 
-    M = np.ones((len(xdata), 6))
-    M[:, 1] = xdata  # p01
+    # fill the columns directly instead of overwriting an all-ones matrix
+    M = np.empty((len(xdata), 6))
+    M[:, 0] = 1.  # p00
+    M[:, 1] = xdata  # p10
     M[:, 2] = ydata  # p01
     M[:, 3] = xdata ** 2  # p20
     M[:, 4] = xdata * ydata  # p11
     M[:, 5] = ydata ** 2  # p02
 
-    poly, res, rnk, s = lstsq(M, zdata)
+    poly, res, rnk, s = _solve_lstsq(M, zdata)
 
     return poly, res, rnk, s
 
@@ -90,11 +138,12 @@ def fit_poly11(xdata, ydata, zdata):
 
     '''
 
-    M = np.ones((len(xdata), 6))
-    M[:, 1] = xdata  # p01
+    M = np.empty((len(xdata), 3))
+    M[:, 0] = 1.  # p00
+    M[:, 1] = xdata  # p10
     M[:, 2] = ydata  # p01
 
-    poly, res, rnk, s = lstsq(M, zdata)
+    poly, res, rnk, s = _solve_lstsq(M, zdata)
 
     return poly, res, rnk, s
 
@@ -125,11 +174,9 @@ def fit_poly2(xdata, zdata):
     # 1d quadratic fit:
     # z = p0 + p1*x + p2*x**2
 
-    M = np.ones((len(xdata), 3))
-    M[:, 1] = xdata  # p1
-    M[:, 2] = xdata ** 2  # p2
+    M = np.vander(xdata, 3, increasing=True)
 
-    poly, res, rnk, s = lstsq(M, zdata)
+    poly, res, rnk, s = _solve_lstsq(M, zdata)
 
     return poly, res, rnk, s
 
@@ -157,10 +204,9 @@ def fit_poly1(xdata, zdata):
 
     '''
 
-    M = np.ones((len(xdata), 2))
-    M[:, 1] = xdata  # p1
+    M = np.vander(xdata, 2, increasing=True)
 
-    poly, res, rnk, s = lstsq(M, zdata)
+    poly, res, rnk, s = _solve_lstsq(M, zdata)
 
     return poly, res, rnk, s
 
@@ -229,37 +275,134 @@ def calculate_xsec(T, P, coeffs):
     coeffs[5,:]           p02
     '''
 
-    logP = np.log10(P)
+    # T and P are scalars, so the plain math functions avoid the numpy
+    # dispatch overhead
+    logP = math.log10(P)
+
+    if numba is not None:
+        return _xsec_kernel(float(T), logP, coeffs)
 
-    poly = np.zeros(6)
-    poly[0] = 1
-    poly[1] = T
-    poly[2] = logP
-    poly[3] = T ** 2
-    poly[4] = T * logP
-    poly[5] = logP ** 2
+    poly = np.array([1., T, logP, T * T, T * logP, logP * logP])
 
-    # allocate
-    sqrtXsec = np.zeros(np.shape(coeffs))
+    # single matrix-vector product instead of a python loop over the
+    # coefficients, which avoids the (6, Nfreq) scratch array
+    Xsec = np.square(poly @ coeffs)
 
-    for i in range(6):
-        sqrtXsec[i, :] = coeffs[i, :] * poly[i]
+    return Xsec
 
-    Xsec = np.sum(sqrtXsec, axis=0) ** 2
+
+def _xsec_kernel(T, logP, coeffs):
+    '''
+    Scalar kernel of `calculate_xsec`, compiled with numba if available.
+    Fuses polynomial evaluation and squaring into a single sweep over
+    the coefficients.
+    '''
+
+    Nfreq = coeffs.shape[1]
+    Xsec = np.empty(Nfreq)
+
+    for k in range(Nfreq):
+        # Horner-like factored form, two fused multiply-add chains
+        a = coeffs[3, k] * T + coeffs[1, k] + coeffs[4, k] * logP
+        b = coeffs[5, k] * logP + coeffs[2, k]
+        s = a * T + b * logP + coeffs[0, k]
+        Xsec[k] = s * s
 
     return Xsec
 
 
+def _xsec_and_derivatives_kernel(T, P, logP, coeffs):
+    '''
+    Scalar kernel of `_xsec_and_derivatives`, compiled with numba if
+    available. Produces the cross section and both derivative arrays in
+    a single sweep over the coefficients, evaluating the sqrt(Xsec)
+    polynomial only once.
+    '''
+
+    Plog = P * _LN10
+
+    Nfreq = coeffs.shape[1]
+    Xsec = np.empty(Nfreq)
+    DxsecDT = np.empty(Nfreq)
+    DxsecDp = np.empty(Nfreq)
+
+    for k in range(Nfreq):
+        # Horner-like factored form; a and b are reused for the
+        # derivative factors
+        a = coeffs[3, k] * T + coeffs[1, k] + coeffs[4, k] * logP
+        b = coeffs[5, k] * logP + coeffs[2, k]
+        s = a * T + b * logP + coeffs[0, k]
+        Xsec[k] = s * s
+        DxsecDT[k] = 2. * (a + coeffs[3, k] * T) * s
+        DxsecDp[k] = 2. * (b + coeffs[5, k] * logP + coeffs[4, k] * T) / Plog * s
+
+    return Xsec, DxsecDT, DxsecDp
+
+
+if numba is not None:
+    _xsec_kernel = numba.njit(cache=True, fastmath=True)(_xsec_kernel)
+    _xsec_and_derivatives_kernel = numba.njit(cache=True, fastmath=True)(_xsec_and_derivatives_kernel)
+
+
+def _xsec_and_derivatives(T, P, coeffs):
+    '''
+    Calculates the absorption cross section and its temperature and
+    pressure derivatives sharing a single evaluation of the sqrt(Xsec)
+    polynomial.
+
+    Args:
+        T: float or matrix
+            Temperature in K.
+        P: float or matrix
+            Pressure in Pa, broadcast against `T`.
+        coeffs: matrix
+            fit coefficients.
+
+    Returns:
+        Xsec: vector or matrix
+            Absorption cross section in m**2.
+        DxsecDT: vector or matrix
+            Temperature derivative.
+        DxsecDp: vector or matrix
+            Pressure derivative.
+
+    '''
+
+    if numba is not None and np.ndim(T) == 0 and np.ndim(P) == 0:
+        return _xsec_and_derivatives_kernel(float(T), float(P), math.log10(P), coeffs)
+
+    p00 = coeffs[0, :]
+    p10 = coeffs[1, :]
+    p01 = coeffs[2, :]
+    p20 = coeffs[3, :]
+    p11 = coeffs[4, :]
+    p02 = coeffs[5, :]
+
+    logP = np.log(P) / _LN10
+
+    # Horner-like factored form; a and b are reused for the derivative
+    # factors
+    a = p20 * T + p10 + p11 * logP
+    b = p02 * logP + p01
+
+    s = a * T + b * logP + p00
+
+    DxsecDT = 2. * (a + p20 * T) * s
+    DxsecDp = 2. * (b + p02 * logP + p11 * T) / (P * _LN10) * s
+
+    return s * s, DxsecDT, DxsecDp
+
+
 def calculate_xsec_fullmodel(T, P, coeffs, minT=0., maxT=np.inf, minP=0, maxP=np.inf):
     '''
     Function to calculate the absorption cross section from the fitted
     coefficients including extrapolation
 
     Args:
-        T: float
+        T: float or vector
             Temperature in K.
-        P: float
-            Pressure in Pa.
+        P: float or vector
+            Pressure in Pa, broadcast against `T`.
         coeffs: matrix
             fit coefficients.
         minT: float
@@ -272,8 +415,10 @@ def calculate_xsec_fullmodel(T, P, coeffs, minT=0., maxT=np.inf, minP=0, maxP=np
             maximum pressure of the data in Pa.
 
     Returns:
-        Xsec: vector
-            Absorption cross section in m**2.
+        Xsec: vector or matrix
+            Absorption cross section in m**2. For scalar `T` and `P` a
+            vector over frequency, otherwise a matrix with one row per
+            (`T`, `P`) pair.
 
 
     The fit model
@@ -292,36 +437,63 @@ def calculate_xsec_fullmodel(T, P, coeffs, minT=0., maxT=np.inf, minP=0, maxP=np
     coeffs[5,:]           p02
     '''
 
-    if (P < minP or P > maxP or
-            T < minT or T > maxT):
+    # scalar path
+    if np.ndim(T) == 0 and np.ndim(P) == 0:
 
-        if P < minP:
-            P0 = minP
+        if (P < minP or P > maxP or
+                T < minT or T > maxT):
 
-        elif P > maxP:
-            P0 = maxP
-        else:
-            P0 = P
-        # P=P0
+            if P < minP:
+                P0 = minP
 
-        if T < minT:
-            T0 = minT
+            elif P > maxP:
+                P0 = maxP
+            else:
+                P0 = P
+            # P=P0
+
+            if T < minT:
+                T0 = minT
+
+            elif T > maxT:
+                T0 = maxT
+
+            else:
+                T0 = T
 
-        elif T > maxT:
-            T0 = maxT
+            # cross section and derivatives share the polynomial evaluation
+            xsec_0, DxsecDT, DxsecDp = _xsec_and_derivatives(T0, P0, coeffs)
+
+            xsec = xsec_0 + DxsecDT * (T - T0) + DxsecDp * (P - P0)
 
         else:
-            T0 = T
+            # calculate raw xsecs
+            xsec = calculate_xsec(T, P, coeffs)
+
+        return xsec
 
-        xsec_0 = calculate_xsec(T0, P0, coeffs)
+    # vectorized path over (T, P) pairs
+    T, P = np.broadcast_arrays(np.atleast_1d(T), np.atleast_1d(P))
 
-        DxsecDT, DxsecDp = xsec_derivative(T0, P0, coeffs)
+    # clamp to the fit limits
+    T0 = np.clip(T, minT, maxT)
+    P0 = np.clip(P, minP, maxP)
+    logP0 = np.log10(P0)
 
-        xsec = xsec_0 + DxsecDT * (T - T0) + DxsecDp * (P - P0)
+    # linear extrapolation where T or P lies outside the fit limits
+    if np.any((T != T0) | (P != P0)):
+        # cross section and derivatives share the polynomial evaluation
+        xsec, DxsecDT, DxsecDp = _xsec_and_derivatives(T0[:, None], P0[:, None], coeffs)
+
+        xsec = (xsec + DxsecDT * (T - T0)[:, None]
+                + DxsecDp * (P - P0)[:, None])
 
     else:
-        # calculate raw xsecs
-        xsec = calculate_xsec(T, P, coeffs)
+        poly = np.stack([np.ones_like(T0), T0, logP0, T0 * T0,
+                         T0 * logP0, logP0 * logP0])
+
+        # (Nlevel, Nfreq) in one matrix product
+        xsec = np.square(poly.T @ coeffs)
 
     return xsec
 
@@ -355,26 +527,7 @@ def xsec_derivative(T, P, coeffs):
 
     '''
 
-    p00 = coeffs[0, :]
-    p10 = coeffs[1, :]
-    p01 = coeffs[2, :]
-    p20 = coeffs[3, :]
-    p11 = coeffs[4, :]
-    p02 = coeffs[5, :]
-
-    log10 = np.log(10.)
-    logP = np.log(P) / log10
-    Plog = P * log10
-
-    DxsecDT = (2.
-               * (p10 + 2. * p20 * T + p11 * logP)
-               * (p00 + p10 * T + p20 * T ** 2 + p01 * logP + p11 * T * logP + p02 * logP ** 2)
-               )
-
-    DxsecDp = (2.
-               * (p01 / Plog + p11 * T / Plog + 2. * p02 * logP / Plog)
-               * (p00 + p10 * T + p20 * T ** 2 + p01 * logP + p11 * T * logP + p02 * logP ** 2)
-               )
+    _, DxsecDT, DxsecDp = _xsec_and_derivatives(T, P, coeffs)
 
     return DxsecDT, DxsecDp
 
@@ -415,643 +568,623 @@ def fit_xsec_data(T, P, Xsec, min_deltaLogP=0.2, min_deltaT=20.):
     coeffs[5,:]           p02
     '''
 
-    logP = np.log10(P)
-
-    sqrtXsec = np.sqrt(Xsec)
-
-    # check for bad values
-    logic_inf = np.isinf(T) | np.isinf(logP) | np.isinf(sqrtXsec)
-    logic_nan = np.isnan(T) | np.isnan(logP) | np.isnan(sqrtXsec)
-    logic_bad = logic_inf | logic_nan
-
-    if np.sum(logic_bad) < len(T):
+    return fit_xsec_data_batch(T, P, np.asarray(Xsec)[:, np.newaxis],
+                               min_deltaLogP=min_deltaLogP,
+                               min_deltaT=min_deltaT)[0]
 
-        # remove bad values
-        xData = T[~logic_bad]
-        yData = logP[~logic_bad]
-        zData = sqrtXsec[~logic_bad]
 
-        # get some information about the data distribution
-        Ndata = np.sum(~logic_bad)
-        Delta_logP = max(yData) - min(yData)
-        Delta_T = max(xData) - min(xData)
+def fit_xsec_data_batch(T, P, Xsec, min_deltaLogP=0.2, min_deltaT=20.):
+    '''
+    Function to calculate the fits of the xsec for all frequencies of a
+    band at once
 
-        # quadratic fit in temperature and pressure
-        if Delta_logP >= min_deltaLogP and Delta_T > min_deltaT and Ndata > 5:
+    The design matrix depends only on `T` and `P`, so all frequencies
+    whose data contains no bad values are fitted with a single lstsq
+    call. Frequencies with bad values are grouped by their bad-value
+    pattern and each group is fitted at once on its cleaned data.
 
-            p, res, rnk, s = fit_poly22(xData, yData, zData)
+    Args:
+        T: vector
+            temperatures.
+        P: vector
+            pressures same lenghth as `T`.
+        Xsec: matrix
+            cross sections with shape (len(`T`), number of frequencies).
+        min_deltaLogP: float, optional
+            minimum variability of log10(`P`) for fit. Defaults to 0.2.
+        min_deltaT: float, optional
+            minimum variability of `T` for fit. Defaults to 20.
 
-            coeffs = p
+    Returns:
+        fit_results: list of dictionaries
+            results of the fits, one entry per frequency.
 
-        # linear fit in temperature and pressure
-        elif Delta_logP >= min_deltaLogP and Delta_T > min_deltaT and Ndata > 2:
+    '''
 
-            p, res, rnk, s = fit_poly11(xData, yData, zData)
+    T = np.asarray(T)
+    Xsec = np.asarray(Xsec)
 
-            coeffs = np.zeros(6)
-            coeffs[0] = p[0]
-            coeffs[1] = p[1]
-            coeffs[2] = p[2]
+    logP = np.log10(P)
 
-        # quadratic fit in temperature
-        elif Delta_logP < min_deltaLogP and Delta_T > min_deltaT and Ndata > 2:
+    sqrtXsec = np.sqrt(Xsec)
 
-            p, res, rnk, s = fit_poly2(xData, zData)
+    # check for bad values, isfinite catches inf and nan in one pass
+    logic_bad_TP = ~(np.isfinite(T) & np.isfinite(logP))
+    logic_bad = logic_bad_TP[:, np.newaxis] | ~np.isfinite(sqrtXsec)
 
-            coeffs = np.zeros(6)
-            coeffs[0] = p[0]
-            coeffs[1] = p[1]
-            coeffs[3] = p[2]
+    # usable data points as far as T and P are concerned
+    rows = ~logic_bad_TP
 
-        # linear fit in temperature
-        elif Delta_logP < min_deltaLogP and Delta_T > min_deltaT and Ndata > 1:
+    # frequencies without additional bad values share the same data
+    # points and therefore the same design matrix
+    if np.any(rows):
+        logic_clean = ~np.any(logic_bad & rows[:, np.newaxis], axis=0)
+    else:
+        logic_clean = np.zeros(np.size(Xsec, axis=1), dtype=bool)
 
-            p, res, rnk, s = fit_poly1(xData, zData)
+    Nfreq = np.size(Xsec, axis=1)
+    fit_results = [None] * Nfreq
 
-            coeffs = np.zeros(6)
-            coeffs[0] = p[0]
-            coeffs[1] = p[1]
+    if np.any(logic_clean):
 
-        # quadratic fit in pressure
-        elif Delta_logP > min_deltaLogP and Delta_T < min_deltaT and Ndata > 2:
+        xData = T[rows]
+        yData = logP[rows]
+        zData = sqrtXsec[np.ix_(rows, logic_clean)]
 
-            p, res, rnk, s = fit_poly2(yData, zData)
+        coeffs, res, rnk, s = _fit_dispatch(xData, yData, zData,
+                                            min_deltaLogP, min_deltaT)
 
-            coeffs = np.zeros(6)
-            coeffs[0] = p[0]
-            coeffs[2] = p[1]
-            coeffs[5] = p[2]
+        MinP = 10. ** yData.min()
+        MaxP = 10. ** yData.max()
 
-        # linear fit in pressure
-        elif Delta_logP > min_deltaLogP and Delta_T < min_deltaT and Ndata > 1:
+        MinT = xData.min()
+        MaxT = xData.max()
 
-            p, res, rnk, s = fit_poly1(yData, zData)
+        Ndata = np.sum(rows)
 
-            coeffs = np.zeros(6)
-            coeffs[0] = p[0]
-            coeffs[2] = p[1]
+        for i, idx in enumerate(np.flatnonzero(logic_clean)):
+            fit_results[idx] = _make_fit_result(coeffs[:, i], _column(res, i),
+                                                rnk, s, MinP, MaxP, MinT, MaxT,
+                                                Ndata)
 
-        # no fit, just mean value
-        else:
-            coeffs = np.zeros(6)
-            coeffs[0] = np.mean(zData)
-
-            res = np.sum((zData - coeffs[0]) ** 2)
-            rnk = np.nan
-            s = np.nan
-
-        MinP = min(10. ** yData)
-        MaxP = max(10. ** yData)
-
-        MinT = min(xData)
-        MaxT = max(xData)
-
-        fit_result = {}
-        fit_result['formula'] = 'p00 + p10*x + p01*y + p20*x**2 + p11*x*y + p02*y**2'
-        fit_result['coeff_names'] = ['p00', 'p10', 'p01', 'p20', 'p11', 'p02']
-        fit_result['coefficients'] = coeffs
-        fit_result['residuum'] = res
-        fit_result['rank'] = rnk
-        fit_result['sgl_val'] = s
-        fit_result['MinP'] = MinP
-        fit_result['MaxP'] = MaxP
-        fit_result['MinT'] = MinT
-        fit_result['MaxT'] = MaxT
-        fit_result['NumberOfPoints'] = Ndata
-        # fit_result['R2']=R2
+    # frequencies with bad values share their design matrix with all
+    # frequencies that miss the same data points, so group them by
+    # bad-value pattern and solve each group with one factorization
+    dirty = np.flatnonzero(~logic_clean)
 
-    else:
-        fit_result = {}
-        fit_result['formula'] = 'p00 + p10*x + p01*y + p20*x**2 + p11*x*y + p02*y**2'
-        fit_result['coeff_names'] = ['p00', 'p10', 'p01', 'p20', 'p11', 'p02']
-        fit_result['coefficients'] = np.zeros(6)
-        fit_result['residuum'] = np.nan
-        fit_result['rank'] = np.nan
-        fit_result['sgl_val'] = np.nan
-        fit_result['MinP'] = np.inf
-        fit_result['MaxP'] = -np.inf
-        fit_result['MinT'] = np.inf
-        fit_result['MaxT'] = -np.inf
-        fit_result['NumberOfPoints'] = 0
+    if dirty.size > 0:
 
-    return fit_result
+        patterns, pattern_idx = np.unique(logic_bad[:, dirty], axis=1,
+                                          return_inverse=True)
 
+        for ip in range(np.size(patterns, axis=1)):
 
-# %% Apllication functions
+            idx_group = dirty[pattern_idx == ip]
+            good = ~patterns[:, ip]
 
-def get_coeff_species(coefficients_folder):
-    '''
-    Convinience function that returns a list with the species inside the coefficients folders.
+            if np.sum(good) > 0:
 
-    Args:
-        coefficients_folder (str): Path of the coefficients folder
+                xData = T[good]
+                yData = logP[good]
+                zData = sqrtXsec[np.ix_(good, idx_group)]
 
-    Returns:
-        all_species (List): List with the Name of each species within the
-                            coefficients folder
+                coeffs, res, rnk, s = _fit_dispatch(xData, yData, zData,
+                                                    min_deltaLogP, min_deltaT)
 
-    '''
+                MinP = 10. ** yData.min()
+                MaxP = 10. ** yData.max()
 
-    filelist = glob(coefficients_folder + '*.xml.bin')
-    filelist.sort()
+                MinT = xData.min()
+                MaxT = xData.max()
 
-    # Get species
-    all_species = []
-    for file in filelist:
+                Ndata = np.sum(good)
 
-        filename = path.basename(file)
-        species = filename.split('.')[0]
+                for i, idx in enumerate(idx_group):
+                    fit_results[idx] = _make_fit_result(coeffs[:, i],
+                                                        _column(res, i),
+                                                        rnk, s, MinP, MaxP,
+                                                        MinT, MaxT, Ndata)
 
-        if species not in all_species:
-            all_species.append(species)
+            else:
+                for idx in idx_group:
+                    fit_results[idx] = _make_fit_result(np.zeros(6), np.nan,
+                                                        np.nan, np.nan,
+                                                        np.inf, -np.inf,
+                                                        np.inf, -np.inf, 0)
 
-    return all_species
+    return fit_results
 
 
-def load_xsec_data(species, coeff_folder):
+def _fit_dispatch(xData, yData, zData, min_deltaLogP, min_deltaT):
     '''
-    Load the xsec data
+    Selects the fit model depending on the variability of the data and
+    executes it.
 
     Args:
-        species (str): Species name.
-        coeff_folder (str): Path to the coefficient folder.
+        xData: vector
+            temperatures without bad values.
+        yData: vector
+            log10 of pressures without bad values.
+        zData: matrix
+            sqrt of cross sections with shape (len(`xData`), K).
+        min_deltaLogP: float
+            minimum variability of `yData` for fit.
+        min_deltaT: float
+            minimum variability of `xData` for fit.
 
     Returns:
-        xsec_data (XsecRecord): Xsec data.
+        coeffs: matrix
+            fit coefficients with shape (6, K).
+        res:    vector or float
+            summed residuums.
+        rnk:    int
+            Effective rank of design matrix M.
+        s:      ndarray or None
+            Singular values of M.
 
     '''
-    xsec_file = path.join(coeff_folder, f'{species}.xml')
-    xsec_data = pyarts.xml.load(xsec_file)
 
-    return xsec_data
+    # get some information about the data distribution
+    Ndata = len(xData)
+    Delta_logP = np.ptp(yData)
+    Delta_T = np.ptp(xData)
 
+    K = np.size(zData, axis=1)
 
-def calculate_cross_sections(wvn_user, xsec_data, temperature=273., pressure=1013e2):
-    '''
-    Calculates absorption cross sections for desired wavenumbers.
+    # quadratic fit in temperature and pressure
+    if Delta_logP >= min_deltaLogP and Delta_T > min_deltaT and Ndata > 5:
 
-    Args:
-        wvn_user (Vector): Wavenumbers in [cm⁻¹].
-        xsec_data (XsecRecord): Xsec data.
-        temperature (Float, optional): Temperature in [K]. Default to 273..
-        pressure (Float, optional): Pressure in [Pa]. Default to 1013e2.
+        p, res, rnk, s = fit_poly22(xData, yData, zData)
 
-    Returns:
-        xsec_user (Vector): Absorption cross section in [m²].
+        coeffs = p
 
-    '''
+    # linear fit in temperature and pressure
+    elif Delta_logP >= min_deltaLogP and Delta_T > min_deltaT and Ndata > 2:
 
-    # convert desired wavenumber to frequency in [Hz]
-    freq_user = wvn_user * c0 * 100
+        p, res, rnk, s = fit_poly11(xData, yData, zData)
 
-    # xsec_coeffs=xsec_data.fitcoeffs
+        coeffs = np.zeros((6, K))
+        coeffs[0] = p[0]
+        coeffs[1] = p[1]
+        coeffs[2] = p[2]
 
-    xsec_user = np.zeros(np.shape(wvn_user))
+    # quadratic fit in temperature
+    elif Delta_logP < min_deltaLogP and Delta_T > min_deltaT and Ndata > 2:
 
-    for m in range(len(xsec_data.fitcoeffs)):
-        # frequency of data in [Hz]
-        freq_data = xsec_data.fitcoeffs[m].grids[0].data
+        p, res, rnk, s = fit_poly2(xData, zData)
 
-        # fit coefficients of band m
-        coeffs_m = xsec_data.fitcoeffs[m].data.data.transpose()
+        coeffs = np.zeros((6, K))
+        coeffs[0] = p[0]
+        coeffs[1] = p[1]
+        coeffs[3] = p[2]
 
-        # Limits of the data. Outside of this limits the cross section are linearly
-        # extrapolated.
-        MinP = xsec_data.fitminpressures.data[m]
-        MaxP = xsec_data.fitmaxpressures.data[m]
-        MinT = xsec_data.fitmintemperatures.data[m]
-        MaxT = xsec_data.fitmaxtemperatures.data[m]
+    # linear fit in temperature
+    elif Delta_logP < min_deltaLogP and Delta_T > min_deltaT and Ndata > 1:
 
-        # Calculate the cross section on their internal frequency grid
-        xsec_temp = calculate_xsec_fullmodel(temperature, pressure, coeffs_m,
-                                             minT=MinT, maxT=MaxT, minP=MinP, maxP=MaxP)
+        p, res, rnk, s = fit_poly1(xData, zData)
 
-        # Interpolate cross sections to user grid
-        f_int = interp1d(freq_data, xsec_temp, fill_value=0., bounds_error=False)
-        xsec_user_m = f_int(freq_user)
+        coeffs = np.zeros((6, K))
+        coeffs[0] = p[0]
+        coeffs[1] = p[1]
 
-        xsec_user = xsec_user + xsec_user_m
+    # quadratic fit in pressure
+    elif Delta_logP > min_deltaLogP and Delta_T < min_deltaT and Ndata > 2:
 
-    return xsec_user
+        p, res, rnk, s = fit_poly2(yData, zData)
 
+        coeffs = np.zeros((6, K))
+        coeffs[0] = p[0]
+        coeffs[2] = p[1]
+        coeffs[5] = p[2]
 
-# %% aux function
+    # linear fit in pressure
+    elif Delta_logP > min_deltaLogP and Delta_T < min_deltaT and Ndata > 1:
 
-def getOverlap(a, b):
-    '''
-    Function to calculate the overlapp between two ranges given
-    by the edges of  each range.
+        p, res, rnk, s = fit_poly1(yData, zData)
 
-    Args:
-        a: vector
-            Edges of range 1.
-        b:  vector
-            Edges of range 2.
-
-    Returns:
-        overlap: float
-            overlap
+        coeffs = np.zeros((6, K))
+        coeffs[0] = p[0]
+        coeffs[2] = p[1]
 
-    '''
+    # no fit, just mean value
+    else:
+        coeffs = np.zeros((6, K))
+        coeffs[0] = np.mean(zData, axis=0)
 
-    return max(0, min(a[1], b[1]) - max(a[0], b[0]))
+        res = np.sum((zData - coeffs[0]) ** 2, axis=0)
+        rnk = np.nan
+        s = np.nan
 
+    return coeffs, res, rnk, s
 
-# %% plotting routines
 
-def cmap_matlab_lines():
+def _column(res, i):
+    '''
+    Returns the residuum of column `i` from a lstsq result. lstsq only
+    returns per-column residuums for full-rank designs, otherwise the
+    result is passed through unchanged.
     '''
 
-    Returns:
-        cmap: matrix
-            Color  map with matlab like line colors.
+    if np.ndim(res) > 0 and np.size(res) > 0:
+        return res[i]
 
+    return res
+
+
+def _make_fit_result(coeffs, res, rnk, s, MinP, MaxP, MinT, MaxT, Ndata):
     '''
+    Assembles the fit result dictionary for a single frequency.
+    '''
+
+    fit_result = {}
+    fit_result['formula'] = 'p00 + p10*x + p01*y + p20*x**2 + p11*x*y + p02*y**2'
+    fit_result['coeff_names'] = ['p00', 'p10', 'p01', 'p20', 'p11', 'p02']
+    fit_result['coefficients'] = coeffs
+    fit_result['residuum'] = res
+    fit_result['rank'] = rnk
+    fit_result['sgl_val'] = s
+    fit_result['MinP'] = MinP
+    fit_result['MaxP'] = MaxP
+    fit_result['MinT'] = MinT
+    fit_result['MaxT'] = MaxT
+    fit_result['NumberOfPoints'] = Ndata
 
-    cmap = np.array([[0, 0.44701, 0.74101, 1],
-                     [0.85001, 0.32501, 0.09801, 1],
-                     [0.92901, 0.69401, 0.12501, 1],
-                     [0.49401, 0.18401, 0.55601, 1],
-                     [0.46601, 0.67401, 0.18801, 1],
-                     [0.30101, 0.74501, 0.93301, 1],
-                     [0.63501, 0.07801, 0.18401, 1]])
+    return fit_result
 
-    return cmap
 
+# %% Apllication functions
 
-def default_figure(rows, columns, width_in_cm=29.7, height_in_cm=20.9,
-                   sharey='all', sharex='all', dpi=150):
+def get_coeff_species(coefficients_folder):
     '''
-    simple function to define basic properties of a figure
+    Convinience function that returns a list with the species inside the coefficients folders.
 
     Args:
-        rows: int
-            rows of plots/axis.
-        columns: int
-            columns of plots/axis.
-        width_in_cm: float
-            figure width in cm.
-        height_in_cm: float
-            figure height in cm.
-        sharey: str
-            marker which y-axis are shared.
-        sharex: str
-            marker which x-axis are shared.
-        dpi: float
-            resolution for inline plots.
+        coefficients_folder (str): Path of the coefficients folder
 
     Returns:
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            matplotlib axis object or ndarray of axis objects.
+        all_species (List): List with the Name of each species within the
+                            coefficients folder
 
     '''
 
-    fig, ax = plt.subplots(rows, columns, sharey=sharey, sharex=sharex, dpi=dpi)
-    fig.set_size_inches(width_in_cm / 2.54, h=height_in_cm / 2.54)
+    filelist = glob(coefficients_folder + '*.xml.bin')
+    filelist.sort()
 
-    return fig, ax
+    # Get species
+    all_species = []
+    for file in filelist:
 
+        filename = path.basename(file)
+        species = filename.split('.')[0]
 
-def set_tick_font(ax, font_name):
+        if species not in all_species:
+            all_species.append(species)
+
+    return all_species
+
+
+def load_xsec_data(species, coeff_folder):
     '''
-    Function to set tick font of x- and y-axis
+    Load the xsec data
 
     Args:
-        ax: matplotlib axis object
-            axis object.
-
-        font_name: str
-            font name.
+        species (str): Species name.
+        coeff_folder (str): Path to the coefficient folder.
 
     Returns:
+        xsec_data (XsecRecord): Xsec data.
 
     '''
+    xsec_file = path.join(coeff_folder, f'{species}.xml')
+    xsec_data = pyarts.xml.load(xsec_file)
 
-    for tick in ax.get_xticklabels():
-        tick.set_fontname(font_name)
+    return xsec_data
 
-    for tick in ax.get_yticklabels():
-        tick.set_fontname(font_name)
 
+# cache for the band data of already seen xsec records, see _get_band_data
+_band_data_cache = {}
 
-def default_plot_format(ax, font_name=None):
+
+def _get_band_data(xsec_data, single_precision=False):
     '''
-    simple function to define basic properties of a plot
+    Returns the fit coefficients of all bands of a xsec record stacked
+    along the frequency dimension together with the band offsets and the
+    frequency grids. The result is cached, so that the stacking is done
+    only once per record.
 
     Args:
-        ax: matplotlib axis object
-            axis object
-
-        font_name: str
-            font name
+        xsec_data (XsecRecord): Xsec data.
+        single_precision (Bool, optional): Store the fit coefficients as
+                                           float32. Defaults to False.
 
     Returns:
-        ax: matplotlib axis object
-            axis object
-
-        font: font properties object
-            font properties
+        band_data (dictionary): Stacked fit coefficients, band offsets and
+                                frequency grids.
 
     '''
 
-    font = FontProperties()
-    if font_name is not None:
-        font.set_name(font_name)
+    key = (id(xsec_data), single_precision)
+    cached = _band_data_cache.get(key)
+
+    if cached is not None:
+        return cached[1]
+    else:
+        dtype = np.float32 if single_precision else np.float64
+        coeffs = [np.ascontiguousarray(c.data.data.transpose(), dtype=dtype)
+                  for c in xsec_data.fitcoeffs]
+
+        band_data = {}
+        band_data['freqs'] = [np.asarray(c.grids[0].data)
+                              for c in xsec_data.fitcoeffs]
+        band_data['offsets'] = np.cumsum([0] + [c.shape[1] for c in coeffs])
+        band_data['big_coeffs'] = np.concatenate(coeffs, axis=1)
 
-    ax.set_prop_cycle(color=cmap_matlab_lines())
+        # fit limits of all bands as flat arrays, so the hot loop does not
+        # have to go through the pyarts objects for every band and call
+        band_data['minP'] = np.asarray(xsec_data.fitminpressures.data)
+        band_data['maxP'] = np.asarray(xsec_data.fitmaxpressures.data)
+        band_data['minT'] = np.asarray(xsec_data.fitmintemperatures.data)
+        band_data['maxT'] = np.asarray(xsec_data.fitmaxtemperatures.data)
 
-    ax.grid(which='both', linestyle=':', linewidth=0.25)
-    ax.spines['right'].set_visible(False)
-    ax.spines['top'].set_visible(False)
-    ax.axes.tick_params(direction='in', which='both')
+        # the entry keeps a strong reference to the record: the cache is
+        # keyed on id(), which may be reused for a new record once the old
+        # one is garbage collected, so an entry must not outlive its record
+        _band_data_cache[key] = (xsec_data, band_data)
 
-    return ax, font
+    return band_data
 
 
-def plot_xsec(wvn, Xsec, XsecFit, ax, xlim=None, xlabel=None, ylabel=None,
-              plot_title=None, legend=False, font_name=None):
+def calculate_cross_sections(wvn_user, xsec_data, temperature=273., pressure=1013e2,
+                             single_precision=False):
     '''
-    Wrapper to plot up to two crossections in a plot. If only one cross section
-    should be plotted set XsecFit to an empty list.
+    Calculates absorption cross sections for desired wavenumbers.
 
     Args:
-        wvn: vector
-            wavenumbers.
-        Xsec: vector
-            cross sections 1.
-        XsecFit:
-            cross sections 2.
-        ax: matplotlib axis object
-            axis object.
-        xlim: vector
-            x-axis limits.
-        xlabel: str
-            label of x-axis.
-        ylabel: str
-            label of y-axis.
-        plot_title: str
-            plot title.
-        legend: boolean
-            flag to switch on or off the plot legend. default is False.
-        font_name: str
-            font name.
-
+        wvn_user (Vector): Wavenumbers in [cm⁻¹].
+        xsec_data (XsecRecord): Xsec data.
+        temperature (Float, optional): Temperature in [K]. Default to 273..
+        pressure (Float, optional): Pressure in [Pa]. Default to 1013e2.
+        single_precision (Bool, optional): Evaluate the fit coefficients in
+            float32. Halves the memory footprint and traffic of the
+            evaluation; the relative error stays well below the residuum
+            of the fit itself. Defaults to False.
 
     Returns:
-        ax: matplotlib axis object or ndarray of axis objects
+        xsec_user (Vector): Absorption cross section in [m²].
 
     '''
 
-    ax, font = default_plot_format(ax, font_name)
+    # convert desired wavenumber to frequency in [Hz]
+    freq_user = wvn_user * c0 * 100
 
-    linewidth = 0.25
+    fu_min = np.min(freq_user)
+    fu_max = np.max(freq_user)
 
-    ax.plot(wvn, Xsec, label='obs', linewidth=linewidth)
+    band_data = _get_band_data(xsec_data, single_precision=single_precision)
+    offsets = band_data['offsets']
 
-    if len(XsecFit) > 0:
-        ax.plot(wvn, XsecFit, '-.', label='fit', linewidth=linewidth)
+    # Calculate sqrt of the cross sections of all bands with one
+    # matrix-vector product over the stacked coefficients
+    logP = math.log10(pressure)
+    T = temperature
+    poly = np.array([1., T, logP, T * T, T * logP, logP * logP],
+                    dtype=band_data['big_coeffs'].dtype)
+    sqrtXsec_all = poly @ band_data['big_coeffs']
 
-    if xlim != None:
-        ax.set_xlim(xlim[0], xlim[1])
+    xsec_user = np.zeros(wvn_user.shape, dtype=np.float64)
 
-    if xlabel != None:
-        ax.set_xlabel(xlabel, fontproperties=font)
+    for m in range(len(band_data['freqs'])):
+        # frequency of data in [Hz]
+        freq_data = band_data['freqs'][m]
 
-    if ylabel != None:
-        ax.set_ylabel(ylabel, fontproperties=font)
+        # bands outside the requested frequency range cannot contribute
+        if freq_data[-1] < fu_min or freq_data[0] > fu_max:
+            continue
 
-    if plot_title != None:
-        ax.set_title(plot_title, fontproperties=font)  # Add a title to the axes.
-        ax.title.set_fontsize(10)
+        # Limits of the data. Outside of this limits the cross section are linearly
+        # extrapolated.
+        MinP = band_data['minP'][m]
+        MaxP = band_data['maxP'][m]
+        MinT = band_data['minT'][m]
+        MaxT = band_data['maxT'][m]
+
+        if MinP <= pressure <= MaxP and MinT <= temperature <= MaxT:
+            # fast path, the sqrt of the cross sections of band m is just
+            # a slice of the stacked result; square in float64 in case the
+            # coefficients are stored in single precision
+            xsec_temp = np.square(sqrtXsec_all[offsets[m]:offsets[m + 1]],
+                                  dtype=np.float64)
+        else:
+            # fit coefficients of band m
+            coeffs_m = band_data['big_coeffs'][:, offsets[m]:offsets[m + 1]]
 
-    if legend:
-        ax.legend()
+            # Calculate the cross section including the extrapolation
+            xsec_temp = calculate_xsec_fullmodel(temperature, pressure, coeffs_m,
+                                                 minT=MinT, maxT=MaxT, minP=MinP, maxP=MaxP)
 
-    return ax
+        # Interpolate cross sections to user grid
+        xsec_user_m = np.interp(freq_user, freq_data, xsec_temp, left=0., right=0.)
 
+        xsec_user = xsec_user + xsec_user_m
 
-def scatter_plot(T, P, data, fig, ax, clim=None, xlabel='Temperature [K]',
-                 ylabel='Pressure [hPa]', plot_title='', cbar_label='',
-                 font_name=None, cmap='speed'):
+    return xsec_user
+
+
+# cache for the band data that was already pushed to the GPU
+_band_data_cache_gpu = {}
+
+
+def _get_band_data_gpu(xsec_data, single_precision=False):
     '''
+    GPU counterpart of `_get_band_data`. Pushes the stacked fit
+    coefficients and the frequency grids to the GPU once per record and
+    caches the device arrays; the fit limits stay on the host.
 
     Args:
-        T: vector
-            temperatures.
-        P: vector
-            pressures same lenghth as `T`.
-        data: vector
-            data same length as `T`.
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            matplotlib axis object or ndarray of axis objects.
-        clim: vector or None
-            value limits for the coloring.
-        xlabel: str
-            label of x-axis
-        ylabel: str
-            label of y-axis
-        plot_title: str
-            plot title
-        cbar_label: str
-            label of colorbar
-        font_name: str
-             font name
-        cmap: str
-            name of colormap
+        xsec_data (XsecRecord): Xsec data.
+        single_precision (Bool, optional): Store the fit coefficients as
+                                           float32. Defaults to False.
 
     Returns:
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            matplotlib axis object or ndarray of axis objects.
+        band_data (dictionary): Band data with the coefficient and
+                                frequency arrays on the GPU.
 
     '''
 
-    ax, font = default_plot_format(ax, font_name)
+    import cupy as cp
 
-    if clim == None:
-        clim = [None, None]
+    key = (id(xsec_data), single_precision)
+    cached = _band_data_cache_gpu.get(key)
 
-    MarkerSize = 50
-    sca = ax.scatter(T, P / 100, MarkerSize, data, cmap=cmap, vmin=clim[0], vmax=clim[1])
-    ax.set_yscale('log')
+    if cached is not None:
+        return cached[1]
+    else:
+        band_data_cpu = _get_band_data(xsec_data,
+                                       single_precision=single_precision)
 
-    cbar = fig.colorbar(sca, ax=ax, shrink=1)
-    cbar.set_label(cbar_label, fontproperties=font)
+        band_data = dict(band_data_cpu)
+        band_data['freqs'] = [cp.asarray(f) for f in band_data_cpu['freqs']]
+        band_data['big_coeffs'] = cp.asarray(band_data_cpu['big_coeffs'])
 
-    ax.set_xlabel(xlabel, fontproperties=font)
-    ax.set_ylabel(ylabel, fontproperties=font)
-    ax.set_title(plot_title, fontproperties=font)
+        # keep a strong reference to the record for the same reason as in
+        # _get_band_data: id() keys may be reused after garbage collection
+        _band_data_cache_gpu[key] = (xsec_data, band_data)
 
-    return fig, ax
+    return band_data
 
 
-def pcolor_plot(x, y, Z, fig, ax, minZ, maxZ, font_name=None, xlabel=None, ylabel=None,
-                cmap=None, title=None, cbar_label=None):
+def calculate_cross_sections_gpu(wvn_user, xsec_data, temperatures, pressures,
+                                 single_precision=False):
     '''
-    wrapper to plot a 2d field
+    Calculates absorption cross sections for desired wavenumbers and
+    many (temperature, pressure) pairs at once on the GPU.
+
+    Needs cupy; the coefficients are pushed to the GPU once per record,
+    so repeated calls only transfer the (T, P) pairs and the result.
 
     Args:
-        x: vector
-            grid in x direction.
-        y: vector
-            grid in y direction.
-        Z: matrix
-            2d field, which will be plotted, with dimensions according to x and y
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            matplotlib axis object or ndarray of axis objects.
-        minZ: float
-            minimum value of colorbar.
-        maxZ: float
-            minimum value of colorbar.
-        font_name: str
-             font name.
-        xlabel: str
-            label of x-axis.
-        ylabel: str
-            label of y-axis.
-        cmap: str
-            name of colormap.
-        title: str
-            plot title
-        cbar_label: str
-            label of colorbar.
+        wvn_user (Vector): Wavenumbers in [cm⁻¹].
+        xsec_data (XsecRecord): Xsec data.
+        temperatures (Vector): Temperatures in [K].
+        pressures (Vector): Pressures in [Pa], same length as
+                            `temperatures`.
+        single_precision (Bool, optional): Evaluate the fit coefficients
+            in float32, see `calculate_cross_sections`. Defaults to False.
 
     Returns:
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            axis object or ndarray of axis objects.
-        pcm: matplotlib pcolormesh object
-            pcolormesh object.
-
-        cbar: matplotlib colorbar object
-            colorbar object.
+        xsec_user (Matrix): Absorption cross section in [m²] with shape
+                            (len(`temperatures`), len(`wvn_user`)).
 
     '''
 
-    ax, font = default_plot_format(ax, font_name)
+    import cupy as cp
 
-    if cmap == None:
-        cmap = plt.get_cmap("Blues")
+    band_data = _get_band_data_gpu(xsec_data,
+                                   single_precision=single_precision)
+    offsets = band_data['offsets']
 
-    # make plot and add colorbar
-    pcm = ax.pcolormesh(x, y, Z, shading='nearest', cmap=cmap, vmin=minZ, vmax=maxZ)
-    pcm.set_rasterized(True)
-    cbar = fig.colorbar(pcm, ax=ax, shrink=1)
-    ax.set_yscale('log')
+    dtype = band_data['big_coeffs'].dtype
 
-    # set the Make-Up and writings
-    ax.set_title(title, fontproperties=font)
-    ax.set_xlabel(xlabel, fontproperties=font)
-    ax.set_ylabel(ylabel, fontproperties=font)
+    T = cp.asarray(temperatures, dtype=dtype)
+    P = cp.asarray(pressures, dtype=dtype)
 
-    cbar.set_label(cbar_label, fontproperties=font)
+    # convert desired wavenumber to frequency in [Hz]
+    freq_user = cp.asarray(wvn_user) * (c0 * 100.)
 
-    return fig, ax, pcm, cbar
+    xsec_user = cp.zeros((T.size, freq_user.size))
 
+    for m in range(len(band_data['freqs'])):
+        freq_data = band_data['freqs'][m]
+        coeffs = band_data['big_coeffs'][:, offsets[m]:offsets[m + 1]]
 
-def make_band_patches(ax, bandwidths, verticalwidth, edgecolor='None', alpha=0.25):
-    '''
-    function to plot patches in plot to mark the band ranges
-    Args:
-        ax: matplotlib axis object or ndarray of axis objects
-            axis object or ndarray of axis objects.
-        bandwidths: list of two component vectors
-            lower and upper border of defined bands
+        # clamp to the fit limits of band m
+        T0 = cp.clip(T, band_data['minT'][m], band_data['maxT'][m])
+        P0 = cp.clip(P, band_data['minP'][m], band_data['maxP'][m])
+        logP0 = cp.log10(P0)
 
-        verticalwidth: vector
-            upper and lower vertical border for plotting
-        edgecolor: colormarker
-            colormarker for the edges of the patches
-        alpha: float
-            alpha blending value, between 0 (transparent) and 1 (opaque).
+        # sqrt of the cross sections of all pairs in one matrix product
+        poly = cp.stack([cp.ones_like(T0), T0, logP0, T0 * T0,
+                         T0 * logP0, logP0 * logP0], axis=1)
+        s = poly @ coeffs
 
+        xsec_temp = s * s
 
-    Returns:
-        ax: matplotlib axis object or ndarray of axis objects
-            axis object or ndarray of axis objects.
+        # linear extrapolation where T or P lies outside the fit limits,
+        # same factored derivative expressions as _xsec_and_derivatives
+        if bool(cp.any((T != T0) | (P != P0))):
+            p10 = coeffs[1, :]
+            p01 = coeffs[2, :]
+            p20 = coeffs[3, :]
+            p11 = coeffs[4, :]
+            p02 = coeffs[5, :]
 
-    '''
+            Tc = T0[:, None]
+            logc = logP0[:, None]
 
-    cmap = cmap_matlab_lines()
+            a = p20 * Tc + p10 + p11 * logc
+            b = p02 * logc + p01
 
-    for x, i in zip(bandwidths, range(len(bandwidths))):
-        idx = i % np.size(cmap, axis=0)
+            DxsecDT = 2. * (a + p20 * Tc) * s
+            DxsecDp = 2. * (b + p02 * logc + p11 * Tc) / (P0[:, None] * _LN10) * s
 
-        color = cmap[idx, :]
+            xsec_temp = (xsec_temp + DxsecDT * (T - T0)[:, None]
+                         + DxsecDp * (P - P0)[:, None])
 
-        patch = ptch.Rectangle((x[0], verticalwidth[0]), x[1] - x[0],
-                               verticalwidth[1] - verticalwidth[0], facecolor=color,
-                               alpha=alpha, edgecolor=edgecolor)
+        # linear interpolation to the user grid for all pairs at once
+        idx = cp.clip(cp.searchsorted(freq_data, freq_user) - 1,
+                      0, freq_data.size - 2)
+        w = (freq_user - freq_data[idx]) / (freq_data[idx + 1] - freq_data[idx])
+        inside = (freq_user >= freq_data[0]) & (freq_user <= freq_data[-1])
 
-        ax.add_patch(patch)
+        xsec_user += cp.where(inside,
+                              (1. - w) * xsec_temp[:, idx]
+                              + w * xsec_temp[:, idx + 1],
+                              0.)
 
-    return ax
+    return xsec_user
 
 
-def plot_raw_data(xsec_data, species, font_name=None, max_num=10000):
+# %% aux function
+
+def getOverlap(a, b):
     '''
-    Function to plot overviews of the raw xsec data
-    Args:
-        xsec_data: list of xsec data
-        species: str
-            name of the species
-        font_name: str
-            font name
-        max_num: int
-            defines how many points of a spectrum is shown. If a
-            spectrum has more more points than only a subset is shown.
+    Function to calculate the overlapp between two ranges given
+    by the edges of  each range.
 
+    Args:
+        a: vector
+            Edges of range 1.
+        b:  vector
+            Edges of range 2.
 
     Returns:
-        fig: matplotlib figure object
-            figure object.
-        ax: matplotlib axis object or ndarray of axis objects
-            matplotlib axis object or ndarray of axis objects.
+        overlap: float
+            overlap
 
     '''
 
-    number_of_sets = len(xsec_data)
-
-    fig1, ax1 = default_figure(number_of_sets, 1, width_in_cm=20.9, height_in_cm=29.7)
-
-    if number_of_sets == 1:
-        ax1 = [ax1]
-
-    for j in range(number_of_sets):
-
-        ax1[j], font = default_plot_format(ax1[j], font_name)
+    return max(0, min(a[1], b[1]) - max(a[0], b[0]))
 
-        for k in range(len(xsec_data[j])):
 
-            wvn = np.linspace(xsec_data[j][k]['wmin'], xsec_data[j][k]['wmax'],
-                              len(xsec_data[j][k]['xsec']))
+def getOverlap_array(a, b):
+    '''
+    Vectorized version of `getOverlap` that calculates the overlap of
+    every pair of ranges in one broadcasted expression.
 
-            XSECS = xsec_data[j][k]['xsec']
+    Args:
+        a: matrix
+            Edges of the first ranges, shape (N, 2).
+        b: matrix
+            Edges of the second ranges, shape (M, 2).
 
-            # if xsec are too detailed, make it it coarser.
-            # it is just an overview plot, so not all details are needed.
-            if len(XSECS) > max_num:
-                idx = int(np.round(len(XSECS) / max_num))
-                ax1[j].plot(wvn[0::idx], XSECS[0::idx], linewidth=0.1)
-            else:
-                ax1[j].plot(wvn, XSECS, linewidth=0.1)
+    Returns:
+        overlap: matrix
+            overlap of every range pair, shape (N, M).
 
-        ax1[j].set_yscale('log')
-        ax1[j].set_ylim(1e-24, 1e-15)
-        ax1[j].grid(which='both', linestyle=':', linewidth=0.25)
-        ax1[j].set_ylabel('$a_{xsec} $[cm$^2$]')
-        ax1[j].set_title(species + ': set ' + str(j) + '; $N_{obs}=$' + str(len(xsec_data[j])) +
-                         ' $; N_{sample}$=' + str(len(wvn)))
+    '''
 
-        if j == number_of_sets:
-            ax1[j].set_xlabel('wavenumber [cm$^{-1}$]')
+    a = np.atleast_2d(a)
+    b = np.atleast_2d(b)
 
-    return fig1, ax1
+    return np.clip(np.minimum(a[:, None, 1], b[None, :, 1])
+                   - np.maximum(a[:, None, 0], b[None, :, 0]), 0., None)
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Sep 25 16:10:11 2020
+
+@author: Manfred Brath
+
+This file contains the plotting routines for the overviews of the Hitran
+absorption cross section data and of the fitting process. They live in
+their own module, so that importing the compute functions from
+Xsec_aux_functions does not pay the matplotlib import cost.
+"""
+import numpy as np
+import matplotlib.patches as ptch
+import matplotlib.pyplot as plt
+from matplotlib.font_manager import FontProperties
+
+# %% plotting routines
+
+def cmap_matlab_lines():
+    '''
+
+    Returns:
+        cmap: matrix
+            Color  map with matlab like line colors.
+
+    '''
+
+    cmap = np.array([[0, 0.44701, 0.74101, 1],
+                     [0.85001, 0.32501, 0.09801, 1],
+                     [0.92901, 0.69401, 0.12501, 1],
+                     [0.49401, 0.18401, 0.55601, 1],
+                     [0.46601, 0.67401, 0.18801, 1],
+                     [0.30101, 0.74501, 0.93301, 1],
+                     [0.63501, 0.07801, 0.18401, 1]])
+
+    return cmap
+
+
+def default_figure(rows, columns, width_in_cm=29.7, height_in_cm=20.9,
+                   sharey='all', sharex='all', dpi=150):
+    '''
+    simple function to define basic properties of a figure
+
+    Args:
+        rows: int
+            rows of plots/axis.
+        columns: int
+            columns of plots/axis.
+        width_in_cm: float
+            figure width in cm.
+        height_in_cm: float
+            figure height in cm.
+        sharey: str
+            marker which y-axis are shared.
+        sharex: str
+            marker which x-axis are shared.
+        dpi: float
+            resolution for inline plots.
+
+    Returns:
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            matplotlib axis object or ndarray of axis objects.
+
+    '''
+
+    fig, ax = plt.subplots(rows, columns, sharey=sharey, sharex=sharex, dpi=dpi)
+    fig.set_size_inches(width_in_cm / 2.54, h=height_in_cm / 2.54)
+
+    return fig, ax
+
+
+def set_tick_font(ax, font_name):
+    '''
+    Function to set tick font of x- and y-axis
+
+    Args:
+        ax: matplotlib axis object
+            axis object.
+
+        font_name: str
+            font name.
+
+    Returns:
+
+    '''
+
+    for tick in ax.get_xticklabels():
+        tick.set_fontname(font_name)
+
+    for tick in ax.get_yticklabels():
+        tick.set_fontname(font_name)
+
+
+def default_plot_format(ax, font_name=None):
+    '''
+    simple function to define basic properties of a plot
+
+    Args:
+        ax: matplotlib axis object
+            axis object
+
+        font_name: str
+            font name
+
+    Returns:
+        ax: matplotlib axis object
+            axis object
+
+        font: font properties object
+            font properties
+
+    '''
+
+    font = FontProperties()
+    if font_name is not None:
+        font.set_name(font_name)
+
+    ax.set_prop_cycle(color=cmap_matlab_lines())
+
+    ax.grid(which='both', linestyle=':', linewidth=0.25)
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.axes.tick_params(direction='in', which='both')
+
+    return ax, font
+
+
+def plot_xsec(wvn, Xsec, XsecFit, ax, xlim=None, xlabel=None, ylabel=None,
+              plot_title=None, legend=False, font_name=None):
+    '''
+    Wrapper to plot up to two crossections in a plot. If only one cross section
+    should be plotted set XsecFit to an empty list.
+
+    Args:
+        wvn: vector
+            wavenumbers.
+        Xsec: vector
+            cross sections 1.
+        XsecFit:
+            cross sections 2.
+        ax: matplotlib axis object
+            axis object.
+        xlim: vector
+            x-axis limits.
+        xlabel: str
+            label of x-axis.
+        ylabel: str
+            label of y-axis.
+        plot_title: str
+            plot title.
+        legend: boolean
+            flag to switch on or off the plot legend. default is False.
+        font_name: str
+            font name.
+
+
+    Returns:
+        ax: matplotlib axis object or ndarray of axis objects
+
+    '''
+
+    ax, font = default_plot_format(ax, font_name)
+
+    linewidth = 0.25
+
+    ax.plot(wvn, Xsec, label='obs', linewidth=linewidth)
+
+    if len(XsecFit) > 0:
+        ax.plot(wvn, XsecFit, '-.', label='fit', linewidth=linewidth)
+
+    if xlim != None:
+        ax.set_xlim(xlim[0], xlim[1])
+
+    if xlabel != None:
+        ax.set_xlabel(xlabel, fontproperties=font)
+
+    if ylabel != None:
+        ax.set_ylabel(ylabel, fontproperties=font)
+
+    if plot_title != None:
+        ax.set_title(plot_title, fontproperties=font)  # Add a title to the axes.
+        ax.title.set_fontsize(10)
+
+    if legend:
+        ax.legend()
+
+    return ax
+
+
+def scatter_plot(T, P, data, fig, ax, clim=None, xlabel='Temperature [K]',
+                 ylabel='Pressure [hPa]', plot_title='', cbar_label='',
+                 font_name=None, cmap='speed'):
+    '''
+
+    Args:
+        T: vector
+            temperatures.
+        P: vector
+            pressures same lenghth as `T`.
+        data: vector
+            data same length as `T`.
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            matplotlib axis object or ndarray of axis objects.
+        clim: vector or None
+            value limits for the coloring.
+        xlabel: str
+            label of x-axis
+        ylabel: str
+            label of y-axis
+        plot_title: str
+            plot title
+        cbar_label: str
+            label of colorbar
+        font_name: str
+             font name
+        cmap: str
+            name of colormap
+
+    Returns:
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            matplotlib axis object or ndarray of axis objects.
+
+    '''
+
+    ax, font = default_plot_format(ax, font_name)
+
+    if clim == None:
+        clim = [None, None]
+
+    MarkerSize = 50
+    sca = ax.scatter(T, P / 100, MarkerSize, data, cmap=cmap, vmin=clim[0], vmax=clim[1])
+    ax.set_yscale('log')
+
+    cbar = fig.colorbar(sca, ax=ax, shrink=1)
+    cbar.set_label(cbar_label, fontproperties=font)
+
+    ax.set_xlabel(xlabel, fontproperties=font)
+    ax.set_ylabel(ylabel, fontproperties=font)
+    ax.set_title(plot_title, fontproperties=font)
+
+    return fig, ax
+
+
+def pcolor_plot(x, y, Z, fig, ax, minZ, maxZ, font_name=None, xlabel=None, ylabel=None,
+                cmap=None, title=None, cbar_label=None):
+    '''
+    wrapper to plot a 2d field
+
+    Args:
+        x: vector
+            grid in x direction.
+        y: vector
+            grid in y direction.
+        Z: matrix
+            2d field, which will be plotted, with dimensions according to x and y
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            matplotlib axis object or ndarray of axis objects.
+        minZ: float
+            minimum value of colorbar.
+        maxZ: float
+            minimum value of colorbar.
+        font_name: str
+             font name.
+        xlabel: str
+            label of x-axis.
+        ylabel: str
+            label of y-axis.
+        cmap: str
+            name of colormap.
+        title: str
+            plot title
+        cbar_label: str
+            label of colorbar.
+
+    Returns:
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            axis object or ndarray of axis objects.
+        pcm: matplotlib pcolormesh object
+            pcolormesh object.
+
+        cbar: matplotlib colorbar object
+            colorbar object.
+
+    '''
+
+    ax, font = default_plot_format(ax, font_name)
+
+    if cmap == None:
+        cmap = plt.get_cmap("Blues")
+
+    # make plot and add colorbar
+    pcm = ax.pcolormesh(x, y, Z, shading='nearest', cmap=cmap, vmin=minZ, vmax=maxZ)
+    pcm.set_rasterized(True)
+    cbar = fig.colorbar(pcm, ax=ax, shrink=1)
+    ax.set_yscale('log')
+
+    # set the Make-Up and writings
+    ax.set_title(title, fontproperties=font)
+    ax.set_xlabel(xlabel, fontproperties=font)
+    ax.set_ylabel(ylabel, fontproperties=font)
+
+    cbar.set_label(cbar_label, fontproperties=font)
+
+    return fig, ax, pcm, cbar
+
+
+def make_band_patches(ax, bandwidths, verticalwidth, edgecolor='None', alpha=0.25):
+    '''
+    function to plot patches in plot to mark the band ranges
+    Args:
+        ax: matplotlib axis object or ndarray of axis objects
+            axis object or ndarray of axis objects.
+        bandwidths: list of two component vectors
+            lower and upper border of defined bands
+
+        verticalwidth: vector
+            upper and lower vertical border for plotting
+        edgecolor: colormarker
+            colormarker for the edges of the patches
+        alpha: float
+            alpha blending value, between 0 (transparent) and 1 (opaque).
+
+
+    Returns:
+        ax: matplotlib axis object or ndarray of axis objects
+            axis object or ndarray of axis objects.
+
+    '''
+
+    cmap = cmap_matlab_lines()
+
+    for x, i in zip(bandwidths, range(len(bandwidths))):
+        idx = i % np.size(cmap, axis=0)
+
+        color = cmap[idx, :]
+
+        patch = ptch.Rectangle((x[0], verticalwidth[0]), x[1] - x[0],
+                               verticalwidth[1] - verticalwidth[0], facecolor=color,
+                               alpha=alpha, edgecolor=edgecolor)
+
+        ax.add_patch(patch)
+
+    return ax
+
+
+def plot_raw_data(xsec_data, species, font_name=None, max_num=10000):
+    '''
+    Function to plot overviews of the raw xsec data
+    Args:
+        xsec_data: list of xsec data
+        species: str
+            name of the species
+        font_name: str
+            font name
+        max_num: int
+            defines how many points of a spectrum is shown. If a
+            spectrum has more more points than only a subset is shown.
+
+
+    Returns:
+        fig: matplotlib figure object
+            figure object.
+        ax: matplotlib axis object or ndarray of axis objects
+            matplotlib axis object or ndarray of axis objects.
+
+    '''
+
+    number_of_sets = len(xsec_data)
+
+    fig1, ax1 = default_figure(number_of_sets, 1, width_in_cm=20.9, height_in_cm=29.7)
+
+    if number_of_sets == 1:
+        ax1 = [ax1]
+
+    for j in range(number_of_sets):
+
+        ax1[j], font = default_plot_format(ax1[j], font_name)
+
+        for k in range(len(xsec_data[j])):
+
+            XSECS = xsec_data[j][k]['xsec']
+            num_samples = len(XSECS)
+
+            # if xsec are too detailed, make it it coarser.
+            # it is just an overview plot, so not all details are needed.
+            if num_samples > max_num:
+                idx = int(np.round(num_samples / max_num))
+            else:
+                idx = 1
+
+            # build the wavenumber grid only for the plotted subset
+            if num_samples > 1:
+                step = ((xsec_data[j][k]['wmax'] - xsec_data[j][k]['wmin'])
+                        / (num_samples - 1))
+            else:
+                step = 0.
+            wvn = (xsec_data[j][k]['wmin']
+                   + np.arange(0, num_samples, idx) * step)
+
+            ax1[j].plot(wvn, XSECS[0::idx], linewidth=0.1)
+
+        ax1[j].set_yscale('log')
+        ax1[j].set_ylim(1e-24, 1e-15)
+        ax1[j].grid(which='both', linestyle=':', linewidth=0.25)
+        ax1[j].set_ylabel('$a_{xsec} $[cm$^2$]')
+        ax1[j].set_title(species + ': set ' + str(j) + '; $N_{obs}=$' + str(len(xsec_data[j])) +
+                         ' $; N_{sample}$=' + str(num_samples))
+
+        if j == number_of_sets:
+            ax1[j].set_xlabel('wavenumber [cm$^{-1}$]')
+
+    return fig1, ax1
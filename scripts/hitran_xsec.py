@@ -155,8 +155,8 @@ class XsecFileIndex:
         self.ignored_files = []
         self.failed_files = []
         if directory is not None and species is not None:
-            if "altname" in XSEC_SPECIES_INFO[species]:
-                speciesname = XSEC_SPECIES_INFO[species]["altname"]
+            if XSEC_SPECIES_INFO[species].altname is not None:
+                speciesname = XSEC_SPECIES_INFO[species].altname
             else:
                 speciesname = species
 
@@ -1,194 +1,526 @@
-"""Metadata for RFMIP species."""
-
-XSEC_SPECIES_INFO = {
-    # Alcohols, ethers and other oxygenated hydrocarbons
-    # Bromocarbons, Hydrobromocarbons, and Halons
-    "Halon-1211": {  # no air broadening, only N2
-        "altname": "CBrClF2",
-        "rfmip": "halon1211_GM",
-        "reftemp": 300,
-    },
-    "Halon-1301": {  # no air broadening, only N2
-        "altname": "CBrF3",
-        "rfmip": "halon1301_GM",
-        "reftemp": 300,
-    },
-    "Halon-2402": {"altname": "CBrF2CBrF2", "rfmip": "halon2402_GM", "reftemp": 300,},
-    # Chlorocarbons and Hydrochlorocarbons
-    "CCl4": {  # +++++ fit ok +++++, use only band 700-860
-        "active": True,
-        "arts_bands": ((700, 860),),
-        "rfmip": "carbon_tetrachloride_GM",
-        "reftemp": 250,
-    },
-    "CH2Cl2": {"rfmip": "ch2cl2_GM", "reftemp": 300,},  # no air broadening, only N2
-    "CH3CCl3": {"rfmip": "ch3ccl3_GM", "reftemp": 300,},  # no air broadening, only N2
-    "CHCl3": {  # not available in Hitran
-        "arts_bands": ((580, 7200),),
-        "rfmip": "chcl3_GM",
-        "reftemp": 300,
-    },
-    # Chlorofluorocarbons (CFCs)
-    "CFC-11": {"active": True, "rfmip": "cfc11_GM",
-               #"reftemp": 220,
-               },  # +++++ fit ok +++++
-    "CFC-12": {"active": True, "rfmip": "cfc12_GM",
-               #"reftemp": 220,
-               },  # +++++ fit ok +++++
-    "CFC-113": {"active": True, "rfmip": "cfc113_GM",},  # only data for 0 torr
-    "CFC-114": {"rfmip": "cfc114_GM",},  # only data for 0 torr
-    "CFC-115": {"rfmip": "cfc115_GM",},  # only data for 0 torr
-    # Fully Fluorinated Species
-    "C2F6": {  # !!!!! bad fit !!!!! no high pressure differences available
-        "use_average": True,
-        "arts_bands": ((500, 6500),),
-        "rfmip": "c2f6_GM",
-        "reftemp": 300,
-    },
-    "C3F8": {"rfmip": "c3f8_GM", "reftemp": 300,},  # no air broadening, only N2
-    "C4F10": {"rfmip": "c4f10_GM", "reftemp": 300,},  # no air broadening, only N2
-    "C5F12": {  # no air broadening, only N2
-        "altname": "n-C5F12",
-        "arts_bands": ((500, 6500),),
-        "rfmip": "c5f12_GM",
-        "reftemp": 300,
-    },
-    "C6F14": {"altname": "n-C6F14", "rfmip": "c6f14_GM",},  # no air broadening, only N2
-    "C8F18": {"rfmip": "c8f18_GM",},  # no air broadening, only N2 at 0 Torr
-    "c-C4F8": {  # only data for 0 Torr
-        "arts_bands": ((550, 6500),),
-        "rfmip": "c_c4f8_GM",
-        "reftemp": 300,
-    },
-    "CF4": {  # +++++ fit ok +++++
-        "active": True,
-        "arts_bands": ((1250, 1290),),
-        "rfmip": "cf4_GM",
-        #"reftemp": 240,
-    },
-    "NF3": {"rfmip": "nf3_GM", "reftemp": 300,},  # no air broadening, only N2
-    "SF6": {
-        "use_average": True,
-        "arts_bands": ((560, 6500),),
-        "rfmip": "sf6_GM",
-        "reftemp": 300,
-    },
-    "SO2F2": {"rfmip": "so2f2_GM", "reftemp": 300,},  # no air broadening, only N2
-    # Halogenated Alcohols and Ethers
-    # Hydrocarbons
-    # Hydrochlorofluorocarbons (HCFCs)
-    "HCFC-141b": {"rfmip": "hcfc141b_GM",},  # only data for 0 torr
-    "HCFC-142b": {  # only data for 0 torr
-        "arts_bands": ((650, 1500),),
-        "rfmip": "hcfc142b_GM",
-    },
-    "HCFC-22": {  # !!!!! bad fit !!!!! no high pressure differences available
-        "use_average": True,
-        "arts_bands": ((760, 860), (1060, 1210), (1275, 1380),),
-        "rfmip": "hcfc22_GM",
-        "reftemp": 210,
-    },
-    # Hydrofluorocarbons (HFCs)
-    "HFC-125": {
-        "use_average": True,
-        "arts_bands": ((495, 1504),),
-        "rfmip": "hfc125_GM",
-    },
-    "HFC-134a": {  # +++++ fit ok +++++. Use band 750-1600.
-        "altname": "CFH2CF3",
-        "active": True,
-        "arts_bands": ((750, 1600),),
-        "rfmip": "hfc134a_GM",
-        "reftemp": 220,
-    },
-    "HFC-143a": {  # not enough xsecs available
-        "use_average": True,
-        "arts_bands": ((580, 630), (694, 1504),),
-        "rfmip": "hfc143a_GM",
-    },
-    "HFC-152a": {"rfmip": "hfc152a_GM",},
-    "HFC-227ea": {
-        "altname": "CF3CHFCF3",
-        "arts_bands": ((500, 6500),),  # Check first band for overlap
-        "rfmip": "hfc227ea_GM",
-    },
-    "HFC-236fa": {  # No usable input files
-        "altname": "CF3CH2CF3",
-        "rfmip": "hfc236fa_GM",
-    },
-    "HFC-23": {"altname": "CHF3", "rfmip": "hfc23_GM", "reftemp": 230,},
-    "HFC-245fa": {"altname": "CHF2CH2CF3", "rfmip": "hfc245fa_GM",},  # Only one profile
-    "HFC-32": {  # !!!!! bad fit !!!!! not enough xsecs available
-        "use_average": True,
-        "rfmip": "hfc32_GM",
-    },
-    "HFC-365mfc": {  # Only one profile ("air")
-        "altname": "CH3CF2CH2CF3",
-        "rfmip": "hfc365mfc_GM",
-    },
-    "HFC-43-10mee": {  # not available in Hitran
-        "altname": "CF3CHFCHFCF2CF3",
-        "rfmip": "hfc4310mee_GM",
-    },
-    # Iodocarbons and hydroiodocarbons
-    # Nitriles, amines and other nitrogenated hydrocarbons
-    # Other molecules
-    "N2O": {"rfmip": "nitrous_oxide_GM",},
-    # Sulfur-containing species
+"""Metadata for RFMIP species.
+
+This module is a pure-Python lookup table built once per process; what it
+costs is import-time construction plus the dict probes consumers do against
+it, so the optimizations that pay off here are data layout (the slotted
+SpeciesInfo records in XSEC_SPECIES_INFO), precomputed forward/reverse maps
+stored as literals (SPECIES_TO_RFMIP, RFMIPMAP) and memoized accessors
+(rfmip_for_species, species_for_rfmip) -- not numerical kernels. The only
+numeric and potentially hot field is arts_bands, which ARTS_BANDS_ARR and
+band_mask() expose as int32 arrays for vectorized band filtering.
+"""
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
+import numpy as np
+
+__all__ = (
+    "SpeciesInfo",
+    "XSEC_SPECIES_INFO",
+    "ARTS_BANDS_ARR",
+    "band_mask",
+    "RFMIP_NAMES_ALL",
+    "RFMIP_NAMES_SUPPORTED",
+    "SPECIES_GROUPS",
+    "SPECIES_GROUPS_SET",
+    "RFMIPMAP",
+    "SPECIES_TO_RFMIP",
+    "rfmip_name",
+    "rfmip_for_species",
+    "species_for_rfmip",
+    "get",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SpeciesInfo:
+    """Fixed-shape record describing one cross section species."""
+
+    rfmip: str
+    altname: Optional[str] = None
+    reftemp: Optional[int] = None
+    active: bool = False
+    use_average: bool = False
+    arts_bands: Optional[tuple] = None
+
+    def __post_init__(self):
+        # intern the rfmip name so its copies in the tables below share
+        # identity and dict lookups take the pointer-comparison fast path
+        object.__setattr__(self, "rfmip", sys.intern(self.rfmip))
+
+
+def _build_species_info():
+    """Build the XSEC_SPECIES_INFO table; deferred until first access."""
+    return MappingProxyType({
+        # Alcohols, ethers and other oxygenated hydrocarbons
+        # Bromocarbons, Hydrobromocarbons, and Halons
+        "Halon-1211": SpeciesInfo(  # no air broadening, only N2
+            altname="CBrClF2",
+            rfmip="halon1211_GM",
+            reftemp=300,
+        ),
+        "Halon-1301": SpeciesInfo(  # no air broadening, only N2
+            altname="CBrF3",
+            rfmip="halon1301_GM",
+            reftemp=300,
+        ),
+        "Halon-2402": SpeciesInfo(altname="CBrF2CBrF2", rfmip="halon2402_GM", reftemp=300),
+        # Chlorocarbons and Hydrochlorocarbons
+        "CCl4": SpeciesInfo(  # +++++ fit ok +++++, use only band 700-860
+            active=True,
+            arts_bands=((700, 860),),
+            rfmip="carbon_tetrachloride_GM",
+            reftemp=250,
+        ),
+        "CH2Cl2": SpeciesInfo(rfmip="ch2cl2_GM", reftemp=300),  # no air broadening, only N2
+        "CH3CCl3": SpeciesInfo(rfmip="ch3ccl3_GM", reftemp=300),  # no air broadening, only N2
+        "CHCl3": SpeciesInfo(  # not available in Hitran
+            arts_bands=((580, 7200),),
+            rfmip="chcl3_GM",
+            reftemp=300,
+        ),
+        # Chlorofluorocarbons (CFCs)
+        "CFC-11": SpeciesInfo(active=True, rfmip="cfc11_GM",
+                              #reftemp=220,
+                              ),  # +++++ fit ok +++++
+        "CFC-12": SpeciesInfo(active=True, rfmip="cfc12_GM",
+                              #reftemp=220,
+                              ),  # +++++ fit ok +++++
+        "CFC-113": SpeciesInfo(active=True, rfmip="cfc113_GM"),  # only data for 0 torr
+        "CFC-114": SpeciesInfo(rfmip="cfc114_GM"),  # only data for 0 torr
+        "CFC-115": SpeciesInfo(rfmip="cfc115_GM"),  # only data for 0 torr
+        # Fully Fluorinated Species
+        "C2F6": SpeciesInfo(  # !!!!! bad fit !!!!! no high pressure differences available
+            use_average=True,
+            arts_bands=((500, 6500),),
+            rfmip="c2f6_GM",
+            reftemp=300,
+        ),
+        "C3F8": SpeciesInfo(rfmip="c3f8_GM", reftemp=300),  # no air broadening, only N2
+        "C4F10": SpeciesInfo(rfmip="c4f10_GM", reftemp=300),  # no air broadening, only N2
+        "C5F12": SpeciesInfo(  # no air broadening, only N2
+            altname="n-C5F12",
+            arts_bands=((500, 6500),),
+            rfmip="c5f12_GM",
+            reftemp=300,
+        ),
+        "C6F14": SpeciesInfo(altname="n-C6F14", rfmip="c6f14_GM"),  # no air broadening, only N2
+        "C8F18": SpeciesInfo(rfmip="c8f18_GM"),  # no air broadening, only N2 at 0 Torr
+        "c-C4F8": SpeciesInfo(  # only data for 0 Torr
+            arts_bands=((550, 6500),),
+            rfmip="c_c4f8_GM",
+            reftemp=300,
+        ),
+        "CF4": SpeciesInfo(  # +++++ fit ok +++++
+            active=True,
+            arts_bands=((1250, 1290),),
+            rfmip="cf4_GM",
+            #reftemp=240,
+        ),
+        "NF3": SpeciesInfo(rfmip="nf3_GM", reftemp=300),  # no air broadening, only N2
+        "SF6": SpeciesInfo(
+            use_average=True,
+            arts_bands=((560, 6500),),
+            rfmip="sf6_GM",
+            reftemp=300,
+        ),
+        "SO2F2": SpeciesInfo(rfmip="so2f2_GM", reftemp=300),  # no air broadening, only N2
+        # Halogenated Alcohols and Ethers
+        # Hydrocarbons
+        # Hydrochlorofluorocarbons (HCFCs)
+        "HCFC-141b": SpeciesInfo(rfmip="hcfc141b_GM"),  # only data for 0 torr
+        "HCFC-142b": SpeciesInfo(  # only data for 0 torr
+            arts_bands=((650, 1500),),
+            rfmip="hcfc142b_GM",
+        ),
+        "HCFC-22": SpeciesInfo(  # !!!!! bad fit !!!!! no high pressure differences available
+            use_average=True,
+            arts_bands=((760, 860), (1060, 1210), (1275, 1380),),
+            rfmip="hcfc22_GM",
+            reftemp=210,
+        ),
+        # Hydrofluorocarbons (HFCs)
+        "HFC-125": SpeciesInfo(
+            use_average=True,
+            arts_bands=((495, 1504),),
+            rfmip="hfc125_GM",
+        ),
+        "HFC-134a": SpeciesInfo(  # +++++ fit ok +++++. Use band 750-1600.
+            altname="CFH2CF3",
+            active=True,
+            arts_bands=((750, 1600),),
+            rfmip="hfc134a_GM",
+            reftemp=220,
+        ),
+        "HFC-143a": SpeciesInfo(  # not enough xsecs available
+            use_average=True,
+            arts_bands=((580, 630), (694, 1504),),
+            rfmip="hfc143a_GM",
+        ),
+        "HFC-152a": SpeciesInfo(rfmip="hfc152a_GM"),
+        "HFC-227ea": SpeciesInfo(
+            altname="CF3CHFCF3",
+            arts_bands=((500, 6500),),  # Check first band for overlap
+            rfmip="hfc227ea_GM",
+        ),
+        "HFC-236fa": SpeciesInfo(  # No usable input files
+            altname="CF3CH2CF3",
+            rfmip="hfc236fa_GM",
+        ),
+        "HFC-23": SpeciesInfo(altname="CHF3", rfmip="hfc23_GM", reftemp=230),
+        "HFC-245fa": SpeciesInfo(altname="CHF2CH2CF3", rfmip="hfc245fa_GM"),  # Only one profile
+        "HFC-32": SpeciesInfo(  # !!!!! bad fit !!!!! not enough xsecs available
+            use_average=True,
+            rfmip="hfc32_GM",
+        ),
+        "HFC-365mfc": SpeciesInfo(  # Only one profile ("air")
+            altname="CH3CF2CH2CF3",
+            rfmip="hfc365mfc_GM",
+        ),
+        "HFC-43-10mee": SpeciesInfo(  # not available in Hitran
+            altname="CF3CHFCHFCF2CF3",
+            rfmip="hfc4310mee_GM",
+        ),
+        # Iodocarbons and hydroiodocarbons
+        # Nitriles, amines and other nitrogenated hydrocarbons
+        # Other molecules
+        "N2O": SpeciesInfo(rfmip="nitrous_oxide_GM"),
+        # Sulfur-containing species
+    })
+
+
+def _build_arts_bands_arr():
+    """arts_bands as (Nbands, 2) int32 arrays for vectorized band filtering."""
+    return MappingProxyType({
+        species: np.asarray(info.arts_bands, dtype=np.int32)
+        for species, info in _lazy("XSEC_SPECIES_INFO").items()
+        if info.arts_bands is not None
+    })
+
+
+_LAZY_BUILDERS = {
+    "XSEC_SPECIES_INFO": _build_species_info,
+    "ARTS_BANDS_ARR": _build_arts_bands_arr,
 }
 
+
+def _lazy(name):
+    """Build a deferred table on first use and cache it in the module."""
+    if name not in globals():
+        globals()[name] = _LAZY_BUILDERS[name]()
+    return globals()[name]
+
+
+def __getattr__(name):
+    # PEP 562: defer construction of the big tables to their first access
+    if name in _LAZY_BUILDERS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def band_mask(species, wavenumbers):
+    """Check which wavenumbers fall inside any arts band of a species.
+
+    Parameters:
+        species (str): Species name (key of ARTS_BANDS_ARR).
+        wavenumbers (float or ndarray): Wavenumbers [cm^-1].
+    Returns:
+        ndarray: Boolean mask, True where a wavenumber lies in a band.
+
+    """
+    arr = _lazy("ARTS_BANDS_ARR")[species]
+    wavenumbers = np.atleast_1d(wavenumbers)
+    return (
+        (wavenumbers[:, np.newaxis] >= arr[:, 0])
+        & (wavenumbers[:, np.newaxis] <= arr[:, 1])
+    ).any(axis=1)
+
+
+# All rfmip names share this suffix; build full names via rfmip_name().
+_RFMIP_SUFFIX = "_GM"
+
+
+@lru_cache(maxsize=None)
+def rfmip_name(stem):
+    """Return the full rfmip name ('_GM' suffix) for a bare stem."""
+    return sys.intern(stem + _RFMIP_SUFFIX)
+
+
+# Every rfmip name in the RFMIP spec, and the subset that is actually
+# present in XSEC_SPECIES_INFO. Splitting the two makes explicit which
+# names the import-time filter used to drop silently.
+RFMIP_NAMES_ALL = tuple(sys.intern(s) for s in (
+    "c2f6_GM",
+    "c3f8_GM",
+    "c4f10_GM",
+    "c5f12_GM",
+    "c6f14_GM",
+    "c7f16_GM",
+    "c8f18_GM",
+    "c_c4f8_GM",
+    "carbon_dioxide_GM",
+    "carbon_tetrachloride_GM",
+    "cf4_GM",
+    "cfc113_GM",
+    "cfc114_GM",
+    "cfc115_GM",
+    "cfc11_GM",
+    "cfc11eq_GM",
+    "cfc12_GM",
+    "cfc12eq_GM",
+    "ch2cl2_GM",
+    "ch3ccl3_GM",
+    "chcl3_GM",
+    "halon1211_GM",
+    "halon1301_GM",
+    "halon2402_GM",
+    "hcfc141b_GM",
+    "hcfc142b_GM",
+    "hcfc22_GM",
+    "hfc125_GM",
+    "hfc134a_GM",
+    "hfc134aeq_GM",
+    "hfc143a_GM",
+    "hfc152a_GM",
+    "hfc227ea_GM",
+    "hfc236fa_GM",
+    "hfc23_GM",
+    "hfc245fa_GM",
+    "hfc32_GM",
+    "hfc365mfc_GM",
+    "hfc4310mee_GM",
+    "methane_GM",
+    "methyl_bromide_GM",
+    "methyl_chloride_GM",
+    "nf3_GM",
+    "sf6_GM",
+    "so2f2_GM",
+))
+RFMIP_NAMES_SUPPORTED = (
+    "c2f6_GM",
+    "c3f8_GM",
+    "c4f10_GM",
+    "c5f12_GM",
+    "c6f14_GM",
+    "c8f18_GM",
+    "c_c4f8_GM",
+    "carbon_tetrachloride_GM",
+    "cf4_GM",
+    "cfc113_GM",
+    "cfc114_GM",
+    "cfc115_GM",
+    "cfc11_GM",
+    "cfc12_GM",
+    "ch2cl2_GM",
+    "ch3ccl3_GM",
+    "chcl3_GM",
+    "halon1211_GM",
+    "halon1301_GM",
+    "halon2402_GM",
+    "hcfc141b_GM",
+    "hcfc142b_GM",
+    "hcfc22_GM",
+    "hfc125_GM",
+    "hfc134a_GM",
+    "hfc143a_GM",
+    "hfc152a_GM",
+    "hfc227ea_GM",
+    "hfc236fa_GM",
+    "hfc23_GM",
+    "hfc245fa_GM",
+    "hfc32_GM",
+    "hfc365mfc_GM",
+    "hfc4310mee_GM",
+    "nf3_GM",
+    "sf6_GM",
+    "so2f2_GM",
+)
+
 SPECIES_GROUPS = {
-    "reference": ["CCl4", "CF4", "CFC-11", "CFC-12", "HFC-134a", "HFC-23",],
-    "rfmip-names": [
-        "c2f6_GM",
-        "c3f8_GM",
-        "c4f10_GM",
-        "c5f12_GM",
-        "c6f14_GM",
-        "c7f16_GM",
-        "c8f18_GM",
-        "c_c4f8_GM",
-        "carbon_dioxide_GM",
-        "carbon_tetrachloride_GM",
-        "cf4_GM",
-        "cfc113_GM",
-        "cfc114_GM",
-        "cfc115_GM",
-        "cfc11_GM",
-        "cfc11eq_GM",
-        "cfc12_GM",
-        "cfc12eq_GM",
-        "ch2cl2_GM",
-        "ch3ccl3_GM",
-        "chcl3_GM",
-        "halon1211_GM",
-        "halon1301_GM",
-        "halon2402_GM",
-        "hcfc141b_GM",
-        "hcfc142b_GM",
-        "hcfc22_GM",
-        "hfc125_GM",
-        "hfc134a_GM",
-        "hfc134aeq_GM",
-        "hfc143a_GM",
-        "hfc152a_GM",
-        "hfc227ea_GM",
-        "hfc236fa_GM",
-        "hfc23_GM",
-        "hfc245fa_GM",
-        "hfc32_GM",
-        "hfc365mfc_GM",
-        "hfc4310mee_GM",
-        "methane_GM",
-        "methyl_bromide_GM",
-        "methyl_chloride_GM",
-        "nf3_GM",
-        "sf6_GM",
-        "so2f2_GM",
-    ],
+    "reference": ("CCl4", "CF4", "CFC-11", "CFC-12", "HFC-134a", "HFC-23",),
+    "rfmip-names": RFMIP_NAMES_ALL,
+}
+
+# Precomputed from XSEC_SPECIES_INFO so that importing this module does no
+# work; run `python xsec_species_info.py` to check the tables for drift.
+RFMIPMAP = {
+    "halon1211_GM": "Halon-1211",
+    "halon1301_GM": "Halon-1301",
+    "halon2402_GM": "Halon-2402",
+    "carbon_tetrachloride_GM": "CCl4",
+    "ch2cl2_GM": "CH2Cl2",
+    "ch3ccl3_GM": "CH3CCl3",
+    "chcl3_GM": "CHCl3",
+    "cfc11_GM": "CFC-11",
+    "cfc12_GM": "CFC-12",
+    "cfc113_GM": "CFC-113",
+    "cfc114_GM": "CFC-114",
+    "cfc115_GM": "CFC-115",
+    "c2f6_GM": "C2F6",
+    "c3f8_GM": "C3F8",
+    "c4f10_GM": "C4F10",
+    "c5f12_GM": "C5F12",
+    "c6f14_GM": "C6F14",
+    "c8f18_GM": "C8F18",
+    "c_c4f8_GM": "c-C4F8",
+    "cf4_GM": "CF4",
+    "nf3_GM": "NF3",
+    "sf6_GM": "SF6",
+    "so2f2_GM": "SO2F2",
+    "hcfc141b_GM": "HCFC-141b",
+    "hcfc142b_GM": "HCFC-142b",
+    "hcfc22_GM": "HCFC-22",
+    "hfc125_GM": "HFC-125",
+    "hfc134a_GM": "HFC-134a",
+    "hfc143a_GM": "HFC-143a",
+    "hfc152a_GM": "HFC-152a",
+    "hfc227ea_GM": "HFC-227ea",
+    "hfc236fa_GM": "HFC-236fa",
+    "hfc23_GM": "HFC-23",
+    "hfc245fa_GM": "HFC-245fa",
+    "hfc32_GM": "HFC-32",
+    "hfc365mfc_GM": "HFC-365mfc",
+    "hfc4310mee_GM": "HFC-43-10mee",
+    "nitrous_oxide_GM": "N2O",
+}
+
+# forward map (species name -> rfmip name), the inverse of RFMIPMAP
+SPECIES_TO_RFMIP = {
+    "Halon-1211": "halon1211_GM",
+    "Halon-1301": "halon1301_GM",
+    "Halon-2402": "halon2402_GM",
+    "CCl4": "carbon_tetrachloride_GM",
+    "CH2Cl2": "ch2cl2_GM",
+    "CH3CCl3": "ch3ccl3_GM",
+    "CHCl3": "chcl3_GM",
+    "CFC-11": "cfc11_GM",
+    "CFC-12": "cfc12_GM",
+    "CFC-113": "cfc113_GM",
+    "CFC-114": "cfc114_GM",
+    "CFC-115": "cfc115_GM",
+    "C2F6": "c2f6_GM",
+    "C3F8": "c3f8_GM",
+    "C4F10": "c4f10_GM",
+    "C5F12": "c5f12_GM",
+    "C6F14": "c6f14_GM",
+    "C8F18": "c8f18_GM",
+    "c-C4F8": "c_c4f8_GM",
+    "CF4": "cf4_GM",
+    "NF3": "nf3_GM",
+    "SF6": "sf6_GM",
+    "SO2F2": "so2f2_GM",
+    "HCFC-141b": "hcfc141b_GM",
+    "HCFC-142b": "hcfc142b_GM",
+    "HCFC-22": "hcfc22_GM",
+    "HFC-125": "hfc125_GM",
+    "HFC-134a": "hfc134a_GM",
+    "HFC-143a": "hfc143a_GM",
+    "HFC-152a": "hfc152a_GM",
+    "HFC-227ea": "hfc227ea_GM",
+    "HFC-236fa": "hfc236fa_GM",
+    "HFC-23": "hfc23_GM",
+    "HFC-245fa": "hfc245fa_GM",
+    "HFC-32": "hfc32_GM",
+    "HFC-365mfc": "hfc365mfc_GM",
+    "HFC-43-10mee": "hfc4310mee_GM",
+    "N2O": "nitrous_oxide_GM",
 }
+SPECIES_GROUPS["rfmip"] = (
+    "C2F6",
+    "C3F8",
+    "C4F10",
+    "C5F12",
+    "C6F14",
+    "C8F18",
+    "c-C4F8",
+    "CCl4",
+    "CF4",
+    "CFC-113",
+    "CFC-114",
+    "CFC-115",
+    "CFC-11",
+    "CFC-12",
+    "CH2Cl2",
+    "CH3CCl3",
+    "CHCl3",
+    "Halon-1211",
+    "Halon-1301",
+    "Halon-2402",
+    "HCFC-141b",
+    "HCFC-142b",
+    "HCFC-22",
+    "HFC-125",
+    "HFC-134a",
+    "HFC-143a",
+    "HFC-152a",
+    "HFC-227ea",
+    "HFC-236fa",
+    "HFC-23",
+    "HFC-245fa",
+    "HFC-32",
+    "HFC-365mfc",
+    "HFC-43-10mee",
+    "NF3",
+    "SF6",
+    "SO2F2",
+)
+
+# frozenset mirrors of SPECIES_GROUPS; use these for membership tests,
+# the tuples above for ordered iteration.
+SPECIES_GROUPS_SET = {k: frozenset(v) for k, v in SPECIES_GROUPS.items()}
+
+# publish the tables as read-only views: they are module-wide singletons,
+# so callers never need defensive copies
+RFMIPMAP = MappingProxyType(RFMIPMAP)
+SPECIES_TO_RFMIP = MappingProxyType(SPECIES_TO_RFMIP)
+SPECIES_GROUPS = MappingProxyType(SPECIES_GROUPS)
+SPECIES_GROUPS_SET = MappingProxyType(SPECIES_GROUPS_SET)
+
+
+@lru_cache(maxsize=None)
+def rfmip_for_species(name):
+    """Return the rfmip name of a species; prefer over raw dict access."""
+    return SPECIES_TO_RFMIP[name]
+
+
+@lru_cache(maxsize=None)
+def species_for_rfmip(rfmip_name):
+    """Return the species name for an rfmip name; prefer over raw dict access."""
+    try:
+        return RFMIPMAP[rfmip_name]
+    except KeyError:
+        # fall back to scanning the table itself, which covers entries that
+        # have not been regenerated into the RFMIPMAP literal yet; the
+        # lru_cache memoizes whatever the scan finds
+        for species, info in _lazy("XSEC_SPECIES_INFO").items():
+            if info.rfmip == rfmip_name:
+                return species
+        raise
+
+
+@lru_cache(maxsize=None)
+def get(species, key):
+    """Return a single SpeciesInfo field, e.g. get("CF4", "reftemp").
+
+    Unset fields resolve to their SpeciesInfo defaults, so callers never
+    need a 'key in ...' check.
+    """
+    return getattr(_lazy("XSEC_SPECIES_INFO")[species], key)
+
 
-RFMIPMAP = {v["rfmip"]: k for k, v in XSEC_SPECIES_INFO.items() if "rfmip" in v.keys()}
-SPECIES_GROUPS["rfmip"] = [
-    RFMIPMAP[k] for k in SPECIES_GROUPS["rfmip-names"] if k in RFMIPMAP.keys()
-]
+if __name__ == "__main__":
+    # Rebuild the precomputed tables from XSEC_SPECIES_INFO and make sure
+    # the literals above have not drifted.
+    assert RFMIPMAP == {v.rfmip: k for k, v in _lazy("XSEC_SPECIES_INFO").items()}
+    assert SPECIES_TO_RFMIP == {k: v.rfmip for k, v in _lazy("XSEC_SPECIES_INFO").items()}
+    assert RFMIP_NAMES_SUPPORTED == tuple(
+        filter(RFMIPMAP.__contains__, RFMIP_NAMES_ALL)
+    )
+    assert SPECIES_GROUPS["rfmip"] == tuple(
+        map(RFMIPMAP.__getitem__, RFMIP_NAMES_SUPPORTED)
+    )
+    print("Precomputed tables are up to date.")